@@ -3,41 +3,253 @@ Analysis Script
 Analyzes experiment results and generates insights
 """
 
+import ast
+import contextlib
+import csv
+import functools
+import hashlib
+import io
+import json
 import pandas as pd
 import numpy as np
 from pathlib import Path
-from collections import Counter
 from scipy import stats
 import sys
+from typing import Optional
 
 import config
-from evaluator import CulturalEvaluator
+from evaluator import CulturalEvaluator, _get_default_evaluator
 from response_parser import ParsedResponse
 from scenarios import get_scenario_by_id
 
 
+# Columns read from results CSVs; the rest (timestamps, parse errors, ...) are skipped
+RESULT_COLUMNS = (
+    'scenario_id', 'scenario_category', 'model', 'culture', 'run_num',
+    'raw_response', 'explanation', 'decision', 'top_values', 'parse_success',
+    'cultural_alignment', 'stereotype',
+)
+
+# Columns stored as pandas categoricals by load_results
+CATEGORICAL_COLUMNS = ('model', 'culture', 'scenario_category', 'decision')
+
+
+@functools.lru_cache(maxsize=None)
+def _literal_value_list(text: str) -> tuple:
+    """
+    Parse a stringified value list once per distinct string
+
+    main.py writes JSON arrays; older results files hold Python list reprs,
+    which fall back to ast.literal_eval.
+    """
+    try:
+        return tuple(json.loads(text))
+    except ValueError:
+        pass
+    try:
+        return tuple(ast.literal_eval(text))
+    except (ValueError, SyntaxError):
+        return ()
+
+
+def parse_top_values(x) -> list:
+    """Convert a top_values cell (list, array or stringified list) to a list"""
+    if isinstance(x, list):
+        return x
+    if isinstance(x, np.ndarray):
+        # Parquet list columns load as object arrays
+        return x.tolist()
+    if isinstance(x, str) and x.startswith('['):
+        return list(_literal_value_list(x))
+    return []
+
+
+def _read_results_csv(results_file: Path, columns: Optional[list] = None) -> pd.DataFrame:
+    """Read a results CSV, using pyarrow's multi-threaded reader when installed"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+    except ImportError:
+        return pd.read_csv(results_file, usecols=columns)
+
+    table = pacsv.read_csv(
+        results_file,
+        # raw_response / explanation contain quoted newlines
+        parse_options=pacsv.ParseOptions(newlines_in_values=True),
+        # Match pd.read_csv: empty fields are NaN and timestamps stay strings
+        convert_options=pacsv.ConvertOptions(
+            include_columns=columns,
+            strings_can_be_null=True,
+            column_types={'timestamp': pa.string()}
+        )
+    )
+    # Release each Arrow column as soon as it has been converted, so peak
+    # memory stays near one copy of the data instead of table + frame
+    return table.to_pandas(split_blocks=True, self_destruct=True)
+
+
+def _csv_header(results_file: Path) -> list:
+    """Column names from the first line of a CSV"""
+    with open(results_file, newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def _read_results_parquet(results_file: Path) -> pd.DataFrame:
+    """Read the analysed columns of a results Parquet file (requires pyarrow)"""
+    import pyarrow.parquet as pq
+
+    names = pq.read_schema(results_file).names
+    columns = [col for col in names if col in RESULT_COLUMNS]
+    return pq.read_table(results_file, columns=columns).to_pandas(
+        split_blocks=True, self_destruct=True
+    )
+
+
+def read_results(results_file: Path) -> pd.DataFrame:
+    """Read a results CSV or Parquet file with top_values parsed into lists"""
+    if results_file.suffix == '.parquet':
+        df = _read_results_parquet(results_file)
+    else:
+        # Only parse the columns the analyses use (in file order; older files
+        # may lack some of them)
+        columns = [col for col in _csv_header(results_file) if col in RESULT_COLUMNS]
+        df = _read_results_csv(results_file, columns)
+
+    # Convert string lists to actual lists (LLM outputs repeat heavily,
+    # so each distinct string is only parsed once)
+    if 'top_values' in df.columns:
+        df['top_values'] = [parse_top_values(x) for x in df['top_values'].to_numpy()]
+
+    return df
+
+
 def load_results(results_file: Path) -> pd.DataFrame:
-    """Load results from CSV"""
+    """Load results from CSV or Parquet"""
     print(f"Loading results from {results_file}")
-    df = pd.read_csv(results_file)
+    df = read_results(results_file)
 
-    # Convert string lists to actual lists
-    if 'top_values' in df.columns:
-        df['top_values'] = df['top_values'].apply(
-            lambda x: eval(x) if isinstance(x, str) and x.startswith('[') else []
-        )
+    # Low-cardinality label columns: categorical codes make groupby and
+    # comparisons integer operations and shrink memory
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
 
     return df
 
 
-def analyze_cultural_bias(df: pd.DataFrame):
+def _one_way_anova(df: pd.DataFrame, by: str, columns: list):
+    """
+    One-way ANOVA of each column across the groups of `by`
+
+    Same statistics as stats.f_oneway, but every column is tested in one
+    pass: group sums come from np.bincount on the factorized keys, so the
+    frame is never split into per-group arrays. NaNs propagate as in
+    f_oneway; rows with a missing key are excluded.
+
+    Returns:
+        (group labels in order of appearance, F statistics, p-values),
+        the last two as arrays aligned with `columns`
+    """
+    codes, uniques = pd.factorize(df[by])
+    keep = codes >= 0
+    codes = codes[keep]
+    values = df[list(columns)].to_numpy(dtype=np.float64)[keep]
+
+    n_groups = len(uniques)
+    dof_between = n_groups - 1
+    dof_within = len(codes) - n_groups
+
+    sizes = np.bincount(codes, minlength=n_groups)[:, None]
+    sums = np.stack(
+        [np.bincount(codes, weights=col, minlength=n_groups) for col in values.T],
+        axis=1
+    )
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = sums / sizes
+        grand_mean = values.mean(axis=0)
+        ss_between = (sizes * (means - grand_mean) ** 2).sum(axis=0)
+        ss_within = ((values - means[codes]) ** 2).sum(axis=0)
+        f_stats = (ss_between / dof_between) / (ss_within / dof_within)
+    p_values = stats.f.sf(f_stats, dof_between, dof_within)
+
+    return np.asarray(uniques), f_stats, p_values
+
+
+def _pairwise_t_tests(df: pd.DataFrame, by: str, column: str, groups):
+    """
+    Student's t-tests of `column` between every pair of `by` groups
+
+    Same statistics as stats.ttest_ind on each pair, from one grouped pass
+    over the frame. A group containing NaN gives NaN t and p values, as in
+    ttest_ind.
+
+    Returns:
+        (mean differences, t statistics, p-values, Cohen's d), each an array
+        over the pairs (i, j) of np.triu_indices(len(groups), k=1)
+    """
+    grouped = df.groupby(by, sort=False, observed=True)[column]
+    summary = grouped.agg(['mean', 'std', 'count']).reindex(groups)
+    has_nan = df[column].isna().groupby(df[by], sort=False, observed=True).any().reindex(groups)
+
+    means = summary['mean'].to_numpy(dtype=np.float64)
+    stds = summary['std'].to_numpy(dtype=np.float64)
+    ns = summary['count'].to_numpy(dtype=np.float64)
+
+    pair_i, pair_j = np.triu_indices(len(groups), k=1)
+    mean_diffs = means[pair_i] - means[pair_j]
+    dof = ns[pair_i] + ns[pair_j] - 2
+
+    # A one-element group has no sample std, but contributes no squared
+    # deviations to the pooled variance either
+    ss = np.where(ns > 1, (ns - 1) * stds ** 2, 0.0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pooled_var = (ss[pair_i] + ss[pair_j]) / dof
+        t_stats = mean_diffs / np.sqrt(pooled_var * (1.0 / ns[pair_i] + 1.0 / ns[pair_j]))
+    t_stats[has_nan.to_numpy(dtype=bool)[pair_i] | has_nan.to_numpy(dtype=bool)[pair_j]] = np.nan
+    p_values = 2 * stats.t.sf(np.abs(t_stats), dof)
+
+    # Effect sizes (Cohen's d)
+    pooled_stds = np.sqrt((stds[pair_i] ** 2 + stds[pair_j] ** 2) / 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cohens_ds = np.where(pooled_stds > 0, mean_diffs / pooled_stds, 0.0)
+
+    return mean_diffs, t_stats, p_values, cohens_ds
+
+
+def _print_block(lines):
+    """Print a block of lines with a single write; an empty block prints nothing"""
+    text = "\n".join(lines)
+    if text:
+        print(text)
+
+
+def _exclude_baseline(df: pd.DataFrame, df_non_baseline: Optional[pd.DataFrame] = None) -> pd.DataFrame:
+    """Rows with cultural prompting; reuses a precomputed slice when given"""
+    if df_non_baseline is not None:
+        return df_non_baseline
+    return df[df['culture'] != 'baseline']
+
+
+def _culture_labels(df: pd.DataFrame, culture_labels: Optional[list] = None) -> list:
+    """Distinct cultures in order of appearance; reuses precomputed labels when given"""
+    if culture_labels is not None:
+        return culture_labels
+    return list(df['culture'].unique())
+
+
+def analyze_cultural_bias(
+        df: pd.DataFrame,
+        df_non_baseline: Optional[pd.DataFrame] = None,
+        culture_labels: Optional[list] = None
+):
     """Analyze overall cultural bias in models"""
     print("\n" + "=" * 80)
     print("CULTURAL BIAS ANALYSIS")
     print("=" * 80)
 
     # Check if baseline exists
-    has_baseline = 'baseline' in df['culture'].unique()
+    has_baseline = 'baseline' in _culture_labels(df, culture_labels)
 
     if has_baseline:
         print("\n🔍 BASELINE BIAS DETECTION")
@@ -45,26 +257,30 @@ def analyze_cultural_bias(df: pd.DataFrame):
         print("-" * 80)
 
         baseline_data = df[df['culture'] == 'baseline']
-        non_baseline_data = df[df['culture'] != 'baseline']
 
         # Calculate baseline profile and compare to each culture
         from evaluator import calculate_baseline_bias
         from response_parser import ParsedResponse
         import config
 
-        baseline_responses = []
-        for _, row in baseline_data.iterrows():
-            parsed = ParsedResponse(  # ← Create ParsedResponse first
-                raw_text=row['raw_response'],
-                explanation=row['explanation'],
-                decision=row.get('decision'),
-                top_values=eval(row.get('top_values', '[]')) if isinstance(row.get('top_values'), str) else row.get(
-                    'top_values', []),
-                parse_success=row['parse_success'],
-                parse_errors=[]
+        # Build (ParsedResponse, scenario_id) tuples straight from the column
+        # arrays - avoids materializing a Series per row like iterrows does
+        cols = ('raw_response', 'explanation', 'decision', 'top_values', 'parse_success', 'scenario_id')
+        arrays = [baseline_data[c].to_numpy() for c in cols]
+        baseline_responses = [
+            (
+                ParsedResponse(
+                    raw_text=raw,
+                    explanation=expl,
+                    decision=dec,
+                    top_values=tv if isinstance(tv, list) else [],
+                    parse_success=ok,
+                    parse_errors=[]
+                ),
+                sid
             )
-            # Now pass as tuple: (ParsedResponse, scenario_id)
-            baseline_responses.append((parsed, row['scenario_id']))  # ← Append tuple with scenario_id
+            for raw, expl, dec, tv, ok, sid in zip(*arrays)
+        ]
 
         if baseline_responses:
             baseline_distances = calculate_baseline_bias(
@@ -78,8 +294,7 @@ def analyze_cultural_bias(df: pd.DataFrame):
 
                 print("\nBaseline Distance from Each Culture:")
                 print("(Lower distance = baseline is closer to this culture's values)")
-                for culture, distance in sorted_distances:
-                    print(f"  {culture:.<30} {distance:.3f}")
+                _print_block(f"  {culture:.<30} {distance:.3f}" for culture, distance in sorted_distances)
 
                 closest = sorted_distances[0]
                 print(f"\n⚠️  INHERENT BIAS DETECTED:")
@@ -88,17 +303,18 @@ def analyze_cultural_bias(df: pd.DataFrame):
                 print(f"\n  The models baseline reasoning most closely resembles {closest[0]} culture.")
 
     # Calculate mean alignment per culture (excluding baseline)
-    culture_data = df[df['culture'] != 'baseline'] if has_baseline else df
-    culture_alignment = culture_data.groupby('culture')['cultural_alignment'].mean().sort_values(ascending=False)
+    culture_data = _exclude_baseline(df, df_non_baseline)
+    culture_alignment = culture_data.groupby('culture', observed=True)['cultural_alignment'].mean().sort_values(ascending=False)
 
     print("\n\nCultural Alignment by Culture (WITH cultural prompting):")
-    for culture, score in culture_alignment.items():
-        print(f"  {culture:.<30} {score:.2f}/10")
+    _print_block(f"  {culture:.<30} {score:.2f}/10" for culture, score in culture_alignment.items())
 
     # Identify Western bias
     western_cultures = ['US']
-    western_score = culture_data[culture_data['culture'].isin(western_cultures)]['cultural_alignment'].mean()
-    non_western_score = culture_data[~culture_data['culture'].isin(western_cultures)]['cultural_alignment'].mean()
+    is_western = culture_data['culture'].isin(western_cultures).to_numpy()
+    alignment = culture_data['cultural_alignment']
+    western_score = alignment[is_western].mean()
+    non_western_score = alignment[~is_western].mean()
 
     print(f"\nWestern vs Non-Western (WITH prompting):")
     print(f"  Western (US):................... {western_score:.2f}/10")
@@ -119,25 +335,24 @@ def analyze_model_performance(df: pd.DataFrame):
 
     metrics = ['cultural_alignment', 'stereotype']
 
-    model_scores = df.groupby('model')[metrics].mean()
+    model_scores = df.groupby('model', observed=True)[metrics].mean()
 
     print("\nModel Performance Summary:")
     print(model_scores.to_string())
 
     # Find best model
-    model_scores['overall'] = model_scores.mean(axis=1)
-    best_model = model_scores['overall'].idxmax()
+    overall = model_scores.mean(axis=1)
+    best_model = overall.idxmax()
 
     print(f"\n🏆 Best Overall Model: {best_model}")
-    print(f"   Overall Score: {model_scores.loc[best_model, 'overall']:.2f}/10")
+    print(f"   Overall Score: {overall[best_model]:.2f}/10")
 
     # Statistical comparison (ANOVA)
     print("\n Statistical Significance Tests (ANOVA):")
 
-    for metric in metrics:
-        groups = [df[df['model'] == model][metric].values for model in df['model'].unique()]
-        f_stat, p_value = stats.f_oneway(*groups)
+    _, f_stats, p_values = _one_way_anova(df, 'model', metrics)
 
+    for metric, f_stat, p_value in zip(metrics, f_stats, p_values):
         sig = "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*" if p_value < 0.05 else "ns"
         print(f"  {metric:.<30} F={f_stat:.2f}, p={p_value:.4f} {sig}")
 
@@ -148,7 +363,7 @@ def analyze_scenario_categories(df: pd.DataFrame):
     print("SCENARIO CATEGORY ANALYSIS")
     print("=" * 80)
 
-    category_stats = df.groupby('scenario_category').agg({
+    category_stats = df.groupby('scenario_category', observed=True).agg({
         'cultural_alignment': ['mean', 'std'],
         'parse_success': 'mean'
     })
@@ -156,8 +371,8 @@ def analyze_scenario_categories(df: pd.DataFrame):
     print("\nPerformance by Category:")
     print(category_stats.to_string())
 
-    # Find hardest and easiest categories
-    cat_means = df.groupby('scenario_category')['cultural_alignment'].mean()
+    # Find hardest and easiest categories (reusing the aggregated means)
+    cat_means = category_stats[('cultural_alignment', 'mean')]
     hardest = cat_means.idxmin()
     easiest = cat_means.idxmax()
 
@@ -168,30 +383,35 @@ def analyze_scenario_categories(df: pd.DataFrame):
     print(f"   Mean Alignment: {cat_means[easiest]:.2f}/10")
 
 
-def analyze_value_patterns(df: pd.DataFrame):
+def _value_counts_by_culture(df: pd.DataFrame) -> pd.Series:
+    """Count top_values per culture (MultiIndex: culture, value), most common first"""
+    return (
+        df[['culture', 'top_values']]
+        .explode('top_values')
+        .dropna(subset=['top_values'])
+        .groupby('culture', sort=False, observed=True)['top_values']
+        .value_counts()
+    )
+
+
+def analyze_value_patterns(df: pd.DataFrame, culture_labels: Optional[list] = None):
     """Analyze patterns in value priorities"""
     print("\n" + "=" * 80)
     print("VALUE PATTERN ANALYSIS")
     print("=" * 80)
 
-    # Extract all values by culture
-    value_counts = {}
-    for culture in df['culture'].unique():
-        culture_data = df[df['culture'] == culture]
-        all_values = []
-        for values_list in culture_data['top_values']:
-            if isinstance(values_list, list):
-                all_values.extend(values_list)
+    # Count all values by culture in one pass, then keep each culture's
+    # top 3 with a single grouped head instead of a lookup per culture
+    top_counts = _value_counts_by_culture(df).groupby(level=0, sort=False, observed=True).head(3)
 
-        from collections import Counter
-        counts = Counter(all_values)
-        value_counts[culture] = counts
+    lines_by_culture = {}
+    for (culture, value), count in top_counts.items():
+        lines_by_culture.setdefault(culture, []).append(f"  {value:.<35} {count}")
 
     print("\nTop 3 Values by Culture:")
-    for culture, counts in value_counts.items():
+    for culture in _culture_labels(df, culture_labels):
         print(f"\n{culture}:")
-        for value, count in counts.most_common(3):
-            print(f"  {value:.<35} {count}")
+        _print_block(lines_by_culture.get(culture, ()))
 
 
 def analyze_consistency(df: pd.DataFrame):
@@ -202,10 +422,14 @@ def analyze_consistency(df: pd.DataFrame):
 
     # Check consistency across runs
     if 'run_num' in df.columns:
-        consistency_by_model = df.groupby('model').agg({
-            'decision': lambda x: x.value_counts().iloc[0] / len(x) if len(x) > 0 else 0,
-            'cultural_alignment': 'std'
-        })
+        # Share of each model's responses that picked its most common decision,
+        # computed with groupby sizes rather than a per-group Python lambda
+        model_groups = df.groupby('model', observed=True)
+        decision_sizes = df.groupby(['model', 'decision'], observed=True).size()
+        consistency_by_model = pd.concat({
+            'decision': decision_sizes.groupby(level=0, observed=True).max() / model_groups.size(),
+            'cultural_alignment': model_groups['cultural_alignment'].std()
+        }, axis=1)
 
         print("\nModel Consistency:")
         print("  (Higher decision consistency = more consistent)")
@@ -221,8 +445,11 @@ def generate_insights(df: pd.DataFrame):
 
     insights = []
 
+    # All overall means in one reduction instead of one column scan each
+    overall = df[['cultural_alignment', 'stereotype', 'parse_success']].mean()
+
     # Overall performance
-    overall_alignment = df['cultural_alignment'].mean()
+    overall_alignment = overall['cultural_alignment']
     if overall_alignment > 7:
         insights.append("✅ Strong overall cultural alignment across models")
     elif overall_alignment > 5:
@@ -231,14 +458,14 @@ def generate_insights(df: pd.DataFrame):
         insights.append("❌ Poor cultural alignment - significant bias present")
 
     # Stereotypes
-    overall_stereo = df['stereotype'].mean()
+    overall_stereo = overall['stereotype']
     if overall_stereo > 8:
         insights.append("✅ Minimal stereotyping in responses")
     else:
         insights.append("⚠️  Some stereotypical language detected")
 
     # Parse success
-    parse_rate = df['parse_success'].mean()
+    parse_rate = overall['parse_success']
     if parse_rate > 0.9:
         insights.append("✅ High parse success rate - good structured outputs")
     else:
@@ -253,7 +480,7 @@ def generate_insights(df: pd.DataFrame):
     print("4. Test with additional cultural contexts for comprehensive coverage")
 
 
-def analyze_cultural_shift_magnitude(df: pd.DataFrame):
+def analyze_cultural_shift_magnitude(df: pd.DataFrame, culture_labels: Optional[list] = None):
     """
     Analyze the magnitude of cultural shift from baseline to prompted responses
 
@@ -264,59 +491,40 @@ def analyze_cultural_shift_magnitude(df: pd.DataFrame):
     print("=" * 80)
     print("Measures how much cultural prompting changes responses vs. baseline\n")
 
-    if 'baseline' not in df['culture'].unique():
+    culture_labels = _culture_labels(df, culture_labels)
+    if 'baseline' not in culture_labels:
         print("⚠️  No baseline data available for shift analysis")
         return
 
-    # Get baseline value distribution
-    baseline_values = []
-    for values_list in df[df['culture'] == 'baseline']['top_values']:
-        if isinstance(values_list, str):
-            values_list = eval(values_list)
-        if isinstance(values_list, list):
-            baseline_values.extend(values_list)
-
-    baseline_counter = Counter(baseline_values)
-    baseline_total = len(baseline_values)
-
-    # Calculate shift for each culture
-    shift_results = {}
-
-    for culture in df['culture'].unique():
-        if culture == 'baseline':
-            continue
-
-        culture_values = []
-        culture_data = df[df['culture'] == culture]
+    cultures = [c for c in culture_labels if c != 'baseline']
 
-        for values_list in culture_data['top_values']:
-            if isinstance(values_list, str):
-                values_list = eval(values_list)
-            if isinstance(values_list, list):
-                culture_values.extend(values_list)
+    # Value counts as a (culture x value) matrix, baseline in the first row
+    counts = _value_counts_by_culture(df).unstack(fill_value=0)
+    counts.index = counts.index.astype(object)
+    counts = counts.reindex(['baseline'] + cultures, fill_value=0)
 
-        culture_counter = Counter(culture_values)
-        culture_total = len(culture_values)
+    # Percentage of each culture's value mentions (cultures without any stay at 0)
+    totals = counts.sum(axis=1)
+    pcts = counts.div(totals.where(totals > 0, 1), axis=0) * 100
 
-        # Calculate total variation distance
-        all_values = set(list(baseline_counter.keys()) + list(culture_counter.keys()))
+    # Shift of every value for every culture vs. baseline in one subtraction;
+    # total variation distance (TVD) = sum of absolute differences / 2
+    shifts = pcts - pcts.loc['baseline']
+    tvds = shifts.abs().sum(axis=1) / 2
 
-        shift_magnitude = 0
-        value_shifts = {}
+    # Only values mentioned by the culture or the baseline are reported
+    mentioned = (counts > 0) | (counts.loc['baseline'] > 0)
 
-        for value in all_values:
-            baseline_pct = (baseline_counter.get(value, 0) / baseline_total * 100) if baseline_total > 0 else 0
-            culture_pct = (culture_counter.get(value, 0) / culture_total * 100) if culture_total > 0 else 0
-            shift = culture_pct - baseline_pct
-            shift_magnitude += abs(shift)
-            value_shifts[value] = shift
+    # Calculate shift for each culture
+    shift_results = {}
 
-        # Total variation distance (TVD) = sum of absolute differences / 2
-        tvd = shift_magnitude / 2
+    for culture in cultures:
+        value_shifts = shifts.loc[culture][mentioned.loc[culture]]
+        tvd = float(tvds[culture])
 
         shift_results[culture] = {
             'tvd': tvd,
-            'value_shifts': value_shifts
+            'value_shifts': value_shifts.to_dict()
         }
 
         print(f"\n{culture}:")
@@ -324,10 +532,10 @@ def analyze_cultural_shift_magnitude(df: pd.DataFrame):
         print(f"  (Higher = more shift from baseline)")
 
         # Show top positive and negative shifts
-        sorted_shifts = sorted(value_shifts.items(), key=lambda x: abs(x[1]), reverse=True)
+        largest = np.argsort(-value_shifts.abs().to_numpy(), kind='stable')[:5]
 
         print(f"\n  Largest Shifts:")
-        for value, shift in sorted_shifts[:5]:
+        for value, shift in value_shifts.iloc[largest].items():
             direction = "↑" if shift > 0 else "↓"
             print(f"    {direction} {value:.<30} {shift:+.1f}%")
 
@@ -354,7 +562,7 @@ def analyze_cultural_shift_magnitude(df: pd.DataFrame):
     return shift_results
 
 
-def analyze_scenario_difficulty(df: pd.DataFrame):
+def analyze_scenario_difficulty(df: pd.DataFrame, df_non_baseline: Optional[pd.DataFrame] = None):
     """
     Analyze which scenarios are hardest/easiest for models to align with cultures
     """
@@ -363,31 +571,35 @@ def analyze_scenario_difficulty(df: pd.DataFrame):
     print("=" * 80)
 
     # Exclude baseline
-    df_filtered = df[df['culture'] != 'baseline'].copy()
+    df_filtered = _exclude_baseline(df, df_non_baseline)
 
     # Calculate mean alignment and variance per scenario
-    scenario_stats = df_filtered.groupby('scenario_id').agg({
-        'cultural_alignment': ['mean', 'std', 'min', 'max'],
-        'parse_success': 'mean'
-    }).round(2)
+    # Named aggregation gives flat column names directly
+    scenario_stats = df_filtered.groupby('scenario_id').agg(
+        cultural_alignment_mean=('cultural_alignment', 'mean'),
+        cultural_alignment_std=('cultural_alignment', 'std'),
+        cultural_alignment_min=('cultural_alignment', 'min'),
+        cultural_alignment_max=('cultural_alignment', 'max'),
+        parse_success_mean=('parse_success', 'mean'),
+    ).round(2)
 
-    scenario_stats.columns = ['_'.join(col).strip('_') for col in scenario_stats.columns.values]
     scenario_stats = scenario_stats.sort_values('cultural_alignment_mean')
 
     print("\nScenarios Ranked by Difficulty (Hardest First):")
     print(scenario_stats.to_string())
 
-    # Identify hardest and easiest
-    hardest = scenario_stats.index[0]
-    easiest = scenario_stats.index[-1]
+    # Identify hardest and easiest (first/last after sorting)
+    scenario_ids = scenario_stats.index.to_numpy()
+    means = scenario_stats['cultural_alignment_mean'].to_numpy()
+    stds = scenario_stats['cultural_alignment_std'].to_numpy()
 
-    print(f"\n\n🔴 HARDEST SCENARIO: {hardest}")
-    print(f"   Mean Alignment: {scenario_stats.loc[hardest, 'cultural_alignment_mean']:.2f}/10")
-    print(f"   Std Dev: {scenario_stats.loc[hardest, 'cultural_alignment_std']:.2f}")
+    print(f"\n\n🔴 HARDEST SCENARIO: {scenario_ids[0]}")
+    print(f"   Mean Alignment: {means[0]:.2f}/10")
+    print(f"   Std Dev: {stds[0]:.2f}")
 
-    print(f"\n🟢 EASIEST SCENARIO: {easiest}")
-    print(f"   Mean Alignment: {scenario_stats.loc[easiest, 'cultural_alignment_mean']:.2f}/10")
-    print(f"   Std Dev: {scenario_stats.loc[easiest, 'cultural_alignment_std']:.2f}")
+    print(f"\n🟢 EASIEST SCENARIO: {scenario_ids[-1]}")
+    print(f"   Mean Alignment: {means[-1]:.2f}/10")
+    print(f"   Std Dev: {stds[-1]:.2f}")
 
     # Variance analysis - which scenarios have most disagreement across cultures
     print(f"\n\n{'─' * 80}")
@@ -399,7 +611,7 @@ def analyze_scenario_difficulty(df: pd.DataFrame):
 
     return scenario_stats
 
-def analyze_statistical_significance(df: pd.DataFrame):
+def analyze_statistical_significance(df: pd.DataFrame, df_non_baseline: Optional[pd.DataFrame] = None):
     """
     Perform statistical significance tests between models and cultures
     """
@@ -408,16 +620,20 @@ def analyze_statistical_significance(df: pd.DataFrame):
     print("=" * 80)
 
     # Exclude baseline for cultural comparisons
-    df_filtered = df[df['culture'] != 'baseline'].copy()
+    df_filtered = _exclude_baseline(df, df_non_baseline)
+
+    # One NaN policy for every test below: responses without an alignment
+    # score are left out of the ANOVAs and the t-tests alike
+    missing = df_filtered['cultural_alignment'].isna()
+    if missing.any():
+        print(f"\nExcluded {int(missing.sum())} responses with no alignment score from all tests")
+        df_filtered = df_filtered[~missing]
 
     # 1. ANOVA: Do models differ significantly?
     print("\n1. MODEL COMPARISON (ANOVA)")
     print("─" * 40)
 
-    model_groups = [df_filtered[df_filtered['model'] == model]['cultural_alignment'].values
-                    for model in df_filtered['model'].unique()]
-
-    f_stat, p_value = stats.f_oneway(*model_groups)
+    models, (f_stat,), (p_value,) = _one_way_anova(df_filtered, 'model', ['cultural_alignment'])
 
     print(f"F-statistic: {f_stat:.4f}")
     print(f"p-value: {p_value:.4f}")
@@ -435,50 +651,45 @@ def analyze_statistical_significance(df: pd.DataFrame):
     print("\n2. PAIRWISE MODEL COMPARISONS (t-tests with Bonferroni correction)")
     print("─" * 40)
 
-    models = df_filtered['model'].unique()
     n_comparisons = len(models) * (len(models) - 1) / 2
     alpha_corrected = 0.05 / n_comparisons
 
     print(f"Bonferroni corrected alpha: {alpha_corrected:.4f}\n")
 
-    for i, model1 in enumerate(models):
-        for model2 in models[i + 1:]:
-            group1 = df_filtered[df_filtered['model'] == model1]['cultural_alignment']
-            group2 = df_filtered[df_filtered['model'] == model2]['cultural_alignment']
-
-            t_stat, p_value = stats.ttest_ind(group1, group2)
-
-            # Calculate effect size (Cohen's d)
-            pooled_std = np.sqrt((group1.std() ** 2 + group2.std() ** 2) / 2)
-            cohens_d = (group1.mean() - group2.mean()) / pooled_std if pooled_std > 0 else 0
-
-            sig = ""
-            if p_value < alpha_corrected:
-                sig = "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*"
-
-            print(f"{model1} vs {model2}:")
-            print(f"  Mean difference: {group1.mean() - group2.mean():+.3f}")
-            print(f"  t-statistic: {t_stat:.3f}, p-value: {p_value:.4f} {sig}")
-            print(f"  Cohen's d: {cohens_d:.3f} ", end="")
-
-            if abs(cohens_d) < 0.2:
-                print("(negligible effect)")
-            elif abs(cohens_d) < 0.5:
-                print("(small effect)")
-            elif abs(cohens_d) < 0.8:
-                print("(medium effect)")
-            else:
-                print("(large effect)")
-            print()
+    mean_diffs, t_stats, p_values, cohens_ds = _pairwise_t_tests(
+        df_filtered, 'model', 'cultural_alignment', models
+    )
+    pair_i, pair_j = np.triu_indices(len(models), k=1)
+
+    for i, j, mean_diff, t_stat, p_value, cohens_d in zip(
+        pair_i, pair_j, mean_diffs, t_stats, p_values, cohens_ds
+    ):
+        model1, model2 = models[i], models[j]
+
+        sig = ""
+        if p_value < alpha_corrected:
+            sig = "***" if p_value < 0.001 else "**" if p_value < 0.01 else "*"
+
+        print(f"{model1} vs {model2}:")
+        print(f"  Mean difference: {mean_diff:+.3f}")
+        print(f"  t-statistic: {t_stat:.3f}, p-value: {p_value:.4f} {sig}")
+        print(f"  Cohen's d: {cohens_d:.3f} ", end="")
+
+        if abs(cohens_d) < 0.2:
+            print("(negligible effect)")
+        elif abs(cohens_d) < 0.5:
+            print("(small effect)")
+        elif abs(cohens_d) < 0.8:
+            print("(medium effect)")
+        else:
+            print("(large effect)")
+        print()
 
     # 3. Culture comparison
     print("\n3. CULTURE COMPARISON (ANOVA)")
     print("─" * 40)
 
-    culture_groups = [df_filtered[df_filtered['culture'] == culture]['cultural_alignment'].values
-                      for culture in df_filtered['culture'].unique()]
-
-    f_stat, p_value = stats.f_oneway(*culture_groups)
+    _, (f_stat,), (p_value,) = _one_way_anova(df_filtered, 'culture', ['cultural_alignment'])
 
     print(f"F-statistic: {f_stat:.4f}")
     print(f"p-value: {p_value:.4f}")
@@ -493,6 +704,24 @@ def analyze_statistical_significance(df: pd.DataFrame):
         print("No significant difference between cultures (p >= 0.05)")
 
 
+def _print_top_decisions(counts: pd.DataFrame, sizes: pd.Series, n: int = 3):
+    """
+    Print the n most frequent decisions per row of a group x decision count matrix
+    """
+    decisions = counts.columns.to_numpy()
+
+    for key, row, total in zip(sizes.index, counts.to_numpy(), sizes.to_numpy()):
+        # Stable sort keeps ties in decision order, matching value_counts
+        order = np.argsort(-row, kind='stable')[:n]
+        order = order[row[order] > 0]
+        lines = [f"\n{key}:"]
+        lines.extend(
+            f"  {decision:.<30} {pct:>5.1f}%"
+            for decision, pct in zip(decisions[order], row[order] / total * 100)
+        )
+        print("\n".join(lines))
+
+
 def analyze_decision_patterns(df: pd.DataFrame):
     """
     Deep dive into decision patterns across models and cultures
@@ -501,110 +730,119 @@ def analyze_decision_patterns(df: pd.DataFrame):
     print("DECISION PATTERN ANALYSIS")
     print("=" * 80)
 
+    # One culture x decision and one model x decision matrix serve every section
+    culture_sizes = df.groupby('culture', observed=True).size().sort_index()
+    model_sizes = df.groupby('model', observed=True).size().sort_index()
+    culture_counts = (
+        df.groupby(['culture', 'decision'], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(culture_sizes.index, fill_value=0)
+    )
+    model_counts = (
+        df.groupby(['model', 'decision'], observed=True)
+        .size()
+        .unstack(fill_value=0)
+        .reindex(model_sizes.index, fill_value=0)
+    )
+
     # Overall decision distribution
     print("\nOVERALL DECISION DISTRIBUTION:")
-    overall_decisions = df['decision'].value_counts()
+    overall_decisions = culture_counts.sum(axis=0).sort_values(ascending=False, kind='stable')
     total = len(df)
 
-    for decision, count in overall_decisions.items():
-        pct = count / total * 100
-        bar = "█" * int(pct / 2)
-        print(f"  {decision:.<30} {count:>4} ({pct:>5.1f}%) {bar}")
+    _print_block(
+        f"  {decision:.<30} {count:>4} ({pct:>5.1f}%) {'█' * int(pct / 2)}"
+        for decision, count, pct in zip(
+            overall_decisions.index, overall_decisions.to_numpy(), overall_decisions.to_numpy() / total * 100
+        )
+    )
 
     # By culture
     print("\n\nDECISION PATTERNS BY CULTURE:")
-
-    for culture in sorted(df['culture'].unique()):
-        culture_data = df[df['culture'] == culture]
-        print(f"\n{culture}:")
-
-        decisions = culture_data['decision'].value_counts()
-        culture_total = len(culture_data)
-
-        for decision, count in decisions.head(3).items():
-            pct = count / culture_total * 100
-            print(f"  {decision:.<30} {pct:>5.1f}%")
+    _print_top_decisions(culture_counts, culture_sizes)
 
     # By model
     print("\n\nDECISION PATTERNS BY MODEL:")
-
-    for model in sorted(df['model'].unique()):
-        model_data = df[df['model'] == model]
-        print(f"\n{model}:")
-
-        decisions = model_data['decision'].value_counts()
-        model_total = len(model_data)
-
-        for decision, count in decisions.head(3).items():
-            pct = count / model_total * 100
-            print(f"  {decision:.<30} {pct:>5.1f}%")
+    _print_top_decisions(model_counts, model_sizes)
 
     # Decision diversity (entropy)
     print("\n\nDECISION DIVERSITY (Entropy):")
     print("(Higher entropy = more diverse decisions, less predictable)")
 
-    from scipy.stats import entropy
+    entropies = stats.entropy(culture_counts.to_numpy(dtype=np.float64), axis=1)
 
-    for culture in sorted(df['culture'].unique()):
-        culture_data = df[df['culture'] == culture]
-        decisions = culture_data['decision'].value_counts(normalize=True)
-        ent = entropy(decisions.values)
-        print(f"  {culture:.<20} {ent:.3f}")
+    _print_block(f"  {culture:.<20} {ent:.3f}" for culture, ent in zip(culture_counts.index, entropies))
 
 
-def analyze_hofstede_comparison(df: pd.DataFrame) -> pd.DataFrame:
+def analyze_hofstede_comparison(df: pd.DataFrame, df_non_baseline: Optional[pd.DataFrame] = None) -> pd.DataFrame:
     """Compare LLM-imputed Hofstede scores with official scores using bucketed [-2, 2] scale."""
     print("\n" + "=" * 80)
     print("HOFSTEDE SCORE COMPARISON: LLM IMPUTED vs OFFICIAL (BUCKETED)")
     print("=" * 80)
 
-    df_filtered = df[df['culture'] != 'baseline'].copy()
+    df_filtered = _exclude_baseline(df, df_non_baseline)
     if df_filtered.empty:
         print("No non-baseline data to analyze")
         return None
 
-    evaluator = CulturalEvaluator()
+    evaluator = _get_default_evaluator()
     comparison_records = []
 
-    for _, row in df_filtered.iterrows():
-        culture = row['culture']
-        model = row['model']
-        scenario_id = row['scenario_id']
-
-        parsed = ParsedResponse(
-            raw_text=row['raw_response'],
-            explanation=row['explanation'],
-            decision=row.get('decision'),
-            top_values=eval(row.get('top_values', '[]')) if isinstance(row.get('top_values'), str) else row.get(
-                'top_values', []),
-            parse_success=row['parse_success'],
+    # Create dimension abbreviation mapping
+    dim_abbr_map = {
+        "power_distance": "PDI",
+        "individualism": "IDV",
+        "masculinity": "MAS",
+        "uncertainty_avoidance": "UAI",
+        "long_term_orientation": "LTO",
+        "indulgence": "IVR"
+    }
+
+    # Pull each column out once and walk the arrays positionally
+    n = len(df_filtered)
+    cols = ('culture', 'model', 'scenario_id', 'raw_response', 'explanation', 'parse_success')
+    culture_arr, model_arr, scenario_arr, raw_arr, expl_arr, success_arr = (
+        df_filtered[c].to_numpy() for c in cols
+    )
+    decision_arr = df_filtered['decision'].to_numpy() if 'decision' in df_filtered else [None] * n
+    values_arr = df_filtered['top_values'].to_numpy() if 'top_values' in df_filtered else [[]] * n
+
+    parsed_rows = [
+        ParsedResponse(
+            raw_text=raw_arr[i],
+            explanation=expl_arr[i],
+            decision=decision_arr[i],
+            top_values=values_arr[i],
+            parse_success=success_arr[i],
             parse_errors=[]
         )
+        for i in range(n)
+    ]
+    # Embed all responses in batches up front; the loop below then hits the cache
+    evaluator.precompute_profiles(parsed_rows)
+
+    for i in range(n):
+        culture = culture_arr[i]
+        model = model_arr[i]
+        scenario_id = scenario_arr[i]
+        parsed = parsed_rows[i]
 
         scenario = get_scenario_by_id(scenario_id)
 
         # Get imputed scores using the evaluator's internal method
         imputed_profile = evaluator._infer_cultural_profile(parsed)
 
-        # Get official scores from config (in -2 to 2 format)
-        official_hofstede = config.CULTURAL_CONTEXTS[culture]['hofstede_scores']
-
-        # Create dimension abbreviation mapping
-        dim_abbr_map = {
-            "power_distance": "PDI",
-            "individualism": "IDV",
-            "masculinity": "MAS",
-            "uncertainty_avoidance": "UAI",
-            "long_term_orientation": "LTO",
-            "indulgence": "IVR"
-        }
+        # Get official scores from config (in -2 to 2 format, NaN if unknown)
+        official_hofstede = config.CULTURES[culture].hofstede
 
         # For each dimension in the scenario
         for dim_name in scenario.cultural_dimensions:
-            if dim_name not in official_hofstede or official_hofstede[dim_name] is None:
+            dim_index = config.DIMENSION_INDEX.get(dim_name)
+            if dim_index is None or np.isnan(official_hofstede[dim_index]):
                 continue
 
-            official_score = official_hofstede[dim_name]
+            official_score = float(official_hofstede[dim_index])
             imputed_score = imputed_profile.get(dim_name, 0.0)
 
             difference = imputed_score - official_score
@@ -736,7 +974,7 @@ def analyze_hofstede_comparison(df: pd.DataFrame) -> pd.DataFrame:
 
     return comparison_df
 
-def analyze_dimension_alignment(df: pd.DataFrame):
+def analyze_dimension_alignment(df: pd.DataFrame, df_non_baseline: Optional[pd.DataFrame] = None):
     """
     Break down cultural alignment into Hofstede dimensions.
 
@@ -748,81 +986,87 @@ def analyze_dimension_alignment(df: pd.DataFrame):
     print("=" * 80)
 
     # We only have expected Hofstede profiles for non-baseline cultures
-    df_non_baseline = df[df['culture'] != 'baseline'].copy()
+    df_non_baseline = _exclude_baseline(df, df_non_baseline)
     if df_non_baseline.empty:
         print("\n⚠️ No non-baseline data available for dimension-level analysis.")
         return
 
-    evaluator = CulturalEvaluator()
-
-    records = []
-
-    for _, row in df_non_baseline.iterrows():
-        culture = row['culture']
-
-        # Skip cultures that don't have Hofstede scores
-        context = config.CULTURAL_CONTEXTS.get(culture)
-        if not context or 'hofstede_scores' not in context:
-            continue
-
-        expected_profile = context['hofstede_scores']
-        if all(v is None for v in expected_profile.values()):
-            # No Hofstede scores defined for this culture
-            continue
+    evaluator = _get_default_evaluator()
+
+    # Expected Hofstede score per (culture, dimension); cultures without
+    # scores simply contribute no rows
+    expected_df = pd.DataFrame(
+        [
+            (culture, dim, expected)
+            for culture, context in config.CULTURAL_CONTEXTS.items()
+            for dim, expected in context.get('hofstede_scores', {}).items()
+            if expected is not None
+        ],
+        columns=['culture', 'dimension', 'expected']
+    )
 
-        scenario = get_scenario_by_id(row['scenario_id'])
-        if not scenario:
-            continue
+    # Dimensions covered by each scenario present in the data
+    scenario_dims = []
+    for scenario_id in df_non_baseline['scenario_id'].unique():
+        scenario = get_scenario_by_id(scenario_id)
+        if scenario:
+            scenario_dims.extend((scenario_id, dim) for dim in scenario.cultural_dimensions)
+    scenario_dims_df = pd.DataFrame(scenario_dims, columns=['scenario_id', 'dimension'])
+
+    # Only rows that can actually be scored need a semantic profile
+    scorable = (
+        df_non_baseline['culture'].isin(expected_df['culture'])
+        & df_non_baseline['scenario_id'].isin(scenario_dims_df['scenario_id'])
+        & df_non_baseline['parse_success'].fillna(True).astype(bool)
+    )
+    df_scored = df_non_baseline[scorable].reset_index(drop=True)
 
-        scenario_dims = scenario.cultural_dimensions
-        if not scenario_dims:
-            continue
+    if df_scored.empty:
+        print("\n⚠️ Could not compute any dimension-level scores (no valid dimensions).")
+        return
 
-        # Build a ParsedResponse from the row so we can reuse _infer_cultural_profile
-        parsed = ParsedResponse(
-            raw_text=row.get('raw_response', ""),
-            explanation=row.get('explanation', ""),
-            decision=row.get('decision') if isinstance(row.get('decision'), str) else None,
-            top_values=row.get('top_values', []) or [],
-            parse_success=bool(row.get('parse_success', True)),
+    # Semantic profile inferred from each response (−2..+2 per dimension)
+    cols = ('raw_response', 'explanation', 'decision', 'top_values')
+    parsed_rows = [
+        ParsedResponse(
+            raw_text=raw,
+            explanation=expl,
+            decision=dec if isinstance(dec, str) else None,
+            top_values=tv or [],
+            parse_success=True,
             parse_errors=[]
         )
+        for raw, expl, dec, tv in zip(*(df_scored[c].to_numpy() for c in cols))
+    ]
+    evaluator.precompute_profiles(parsed_rows)
+    profiles = [evaluator._infer_cultural_profile(parsed) for parsed in parsed_rows]
+    actual_df = (
+        pd.DataFrame(profiles)
+        .rename_axis(index='row', columns='dimension')
+        .stack()
+        .rename('actual')
+        .reset_index()
+    )
 
-        if not parsed.parse_success:
-            continue
-
-        # Semantic profile inferred from the response (−2..+2 per dimension)
-        response_profile = evaluator._infer_cultural_profile(parsed)
-
-        for dim in scenario_dims:
-            if dim not in expected_profile or dim not in response_profile:
-                continue
-
-            expected = expected_profile[dim]
-            actual = response_profile[dim]
-
-            if expected is None or actual is None:
-                continue
-
-            # Same basic scoring idea as overall alignment:
-            #  - diff = 0   →  score ≈ 10
-            #  - diff = 4   →  score ≈ 0 (max separation on −2..+2)
-            diff = abs(expected - actual)
-            dim_score = max(0.0, 10.0 - diff * 2.5)
-
-            records.append({
-                "model": row["model"],
-                "culture": culture,
-                "scenario_id": row["scenario_id"],
-                "dimension": dim,
-                "dimension_alignment": dim_score
-            })
+    dim_df = (
+        df_scored[['model', 'culture', 'scenario_id']]
+        .rename_axis('row')
+        .reset_index()
+        .merge(scenario_dims_df, on='scenario_id')
+        .merge(expected_df, on=['culture', 'dimension'])
+        .merge(actual_df, on=['row', 'dimension'])
+    )
 
-    if not records:
+    if dim_df.empty:
         print("\n⚠️ Could not compute any dimension-level scores (no valid dimensions).")
         return
 
-    dim_df = pd.DataFrame(records)
+    # Same basic scoring idea as overall alignment:
+    #  - diff = 0   →  score ≈ 10
+    #  - diff = 4   →  score ≈ 0 (max separation on −2..+2)
+    dim_df['dimension_alignment'] = np.clip(
+        10.0 - (dim_df['expected'] - dim_df['actual']).abs() * 2.5, 0.0, None
+    )
 
     # ------------------------------------------------------------------
     # Aggregations
@@ -830,7 +1074,7 @@ def analyze_dimension_alignment(df: pd.DataFrame):
     print("\nMean dimension alignment by culture (higher = closer to Hofstede):")
     culture_dim = (
         dim_df
-        .groupby(["culture", "dimension"])["dimension_alignment"]
+        .groupby(["culture", "dimension"], observed=True)["dimension_alignment"]
         .mean()
         .unstack()
         .round(2)
@@ -841,7 +1085,7 @@ def analyze_dimension_alignment(df: pd.DataFrame):
     print("\nMean dimension alignment by model:")
     model_dim = (
         dim_df
-        .groupby(["model", "dimension"])["dimension_alignment"]
+        .groupby(["model", "dimension"], observed=True)["dimension_alignment"]
         .mean()
         .unstack()
         .round(2)
@@ -867,48 +1111,108 @@ def analyze_dimension_alignment(df: pd.DataFrame):
     # dim_output = results_file.parent / f"dimension_alignment_{results_file.stem}.csv"
     # dim_df.to_csv(dim_output, index=False)
 
-def create_analysis_report(results_file: Path):
-    """Create complete analysis report"""
-    df = load_results(results_file)
+def _report_cache_file(results_file: Path):
+    """
+    Cache path and validity key for the rendered report of a results file
+
+    There is one cache file per results file, overwritten whenever the key
+    changes. The key covers the results file's mtime and size, the
+    modification times of the modules that shape the report (analysis code,
+    config, evaluator, scenario definitions) and the embedding model
+    settings, so editing any of them invalidates the cached report.
+
+    Returns:
+        (cache file path, key stored on the cache file's first line)
+    """
+    path = str(results_file.resolve())
+    stat = results_file.stat()
+    parts = [path, str(stat.st_mtime_ns), str(stat.st_size),
+             config.EMBEDDING_MODEL, config.EMBEDDING_BACKEND, str(config.EMBEDDING_FP16)]
+    for module in (__name__, config.__name__, CulturalEvaluator.__module__, get_scenario_by_id.__module__):
+        parts.append(str(Path(sys.modules[module].__file__).stat().st_mtime_ns))
+    key = hashlib.blake2b(':'.join(parts).encode(), digest_size=8).hexdigest()
+    name = hashlib.blake2b(path.encode(), digest_size=8).hexdigest()
+    return config.CACHE_DIR / f"analysis_{name}.txt", key
+
+
+def _read_cached_report(cache_file: Path, key: str) -> Optional[str]:
+    """Cached report text if the cache file exists and was written under key"""
+    if not cache_file.exists():
+        return None
+    stored_key, _, report = cache_file.read_text(encoding='utf-8').partition('\n')
+    return report if stored_key == key else None
+
+
+def _render_report(results_file: Path, df: pd.DataFrame) -> str:
+    """
+    Run every analysis and return the report text
+
+    The analyses print hundreds of short lines; collecting them in memory
+    lets the caller emit the whole report with a single write. If an
+    analysis fails, the part rendered so far is still printed.
+    """
+    # Slice out the culturally-prompted rows and list the labels once, and
+    # share them across analyses
+    df_non_baseline = _exclude_baseline(df)
+    culture_labels = list(df['culture'].unique())
+    model_labels = list(df['model'].unique())
+
+    buffer = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(buffer):
+            print("\n" + "=" * 80)
+            print("CULTURAL BIAS MEASUREMENT - ANALYSIS REPORT")
+            print("=" * 80)
+            print(f"\nDataset: {results_file.name}")
+            print(f"Total Responses: {len(df)}")
+            print(f"Models: {', '.join(model_labels)}")
+            print(f"Cultures: {', '.join(culture_labels)}")
+            print(f"Scenarios: {df['scenario_id'].nunique()}")
+
+            analyze_cultural_bias(df, df_non_baseline, culture_labels)
+            analyze_dimension_alignment(df, df_non_baseline)
+            analyze_hofstede_comparison(df, df_non_baseline)
+            analyze_model_performance(df)
+            analyze_scenario_categories(df)
+            analyze_value_patterns(df, culture_labels)
+            analyze_consistency(df)
+            generate_insights(df)
+            analyze_cultural_shift_magnitude(df, culture_labels)
+            analyze_scenario_difficulty(df, df_non_baseline)
+            analyze_statistical_significance(df, df_non_baseline)
+            analyze_decision_patterns(df)
+    except BaseException:
+        sys.stdout.write(buffer.getvalue())
+        raise
+
+    return buffer.getvalue()
+
+
+def create_analysis_report(results_file: Path, use_cache: Optional[bool] = None):
+    """Create complete analysis report (use_cache defaults to config.ENABLE_CACHE)"""
+    if use_cache is None:
+        use_cache = config.ENABLE_CACHE
 
     # Create output file path
     output_file = results_file.parent / f"analysis_report_{results_file.stem}.txt"
 
-    # Save to file AND print to console
-    import sys
-    original_stdout = sys.stdout
-
-    with open(output_file, 'w', encoding='utf-8') as f:
-        # Duplicate output to both console and file
-        sys.stdout = type('DualOutput', (), {
-            'write': lambda self, text: (original_stdout.write(text), f.write(text)),
-            'flush': lambda self: (original_stdout.flush(), f.flush())
-        })()
-
-        print("\n" + "=" * 80)
-        print("CULTURAL BIAS MEASUREMENT - ANALYSIS REPORT")
-        print("=" * 80)
-        print(f"\nDataset: {results_file.name}")
-        print(f"Total Responses: {len(df)}")
-        print(f"Models: {', '.join(df['model'].unique())}")
-        print(f"Cultures: {', '.join(df['culture'].unique())}")
-        print(f"Scenarios: {df['scenario_id'].nunique()}")
-
-        analyze_cultural_bias(df)
-        analyze_dimension_alignment(df)
-        analyze_hofstede_comparison(df)
-        analyze_model_performance(df)
-        analyze_scenario_categories(df)
-        analyze_value_patterns(df)
-        analyze_consistency(df)
-        generate_insights(df)
-        analyze_cultural_shift_magnitude(df)
-        analyze_scenario_difficulty(df)
-        analyze_statistical_significance(df)
-        analyze_decision_patterns(df)
-
-    sys.stdout = original_stdout
-    print(f"\n✅ Full analysis saved to: {output_file}")
+    cache_file, key = _report_cache_file(results_file) if use_cache else (None, None)
+    report = _read_cached_report(cache_file, key) if cache_file is not None else None
+    if report is not None:
+        # Unchanged data and code: replay the stored report instead of
+        # re-reading the CSV and recomputing every analysis
+        note = " (cached)"
+    else:
+        report = _render_report(results_file, load_results(results_file))
+        note = ""
+        if cache_file is not None:
+            cache_file.write_text(f"{key}\n{report}", encoding='utf-8')
+
+    # Save to file AND print to console, one write each
+    output_file.write_text(report, encoding='utf-8')
+    sys.stdout.write(report)
+
+    print(f"\n✅ Full analysis saved to: {output_file}{note}")
 
     print("\n" + "=" * 80)
     print("END OF REPORT")
@@ -922,7 +1226,12 @@ if __name__ == "__main__":
     parser.add_argument(
         "results_file",
         type=Path,
-        help="Path to results CSV file"
+        help="Path to results CSV or Parquet file"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Recompute the report even if a cached copy exists"
     )
 
     args = parser.parse_args()
@@ -931,4 +1240,4 @@ if __name__ == "__main__":
         print(f"Error: File not found: {args.results_file}")
         sys.exit(1)
 
-    create_analysis_report(args.results_file)
+    create_analysis_report(args.results_file, use_cache=config.ENABLE_CACHE and not args.no_cache)
@@ -3,13 +3,14 @@ Configuration for cultural bias measurement
 FIXED: Balanced VALUE_OPTIONS covering all 6 Hofstede dimensions
 """
 
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
-from dotenv import load_dotenv
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 
-# Load environment variables from .env file
-load_dotenv()
+import numpy as np
 
 # ============================================================================
 # PROJECT PATHS
@@ -26,12 +27,25 @@ for directory in [RESULTS_DIR, VISUALIZATIONS_DIR, CACHE_DIR]:
 
 # ============================================================================
 # API KEYS (Set as environment variables)
+# Resolved on first access (config.OPENAI_API_KEY etc.), so importing config
+# does not read .env and keys are only looked up when a provider is used
 # ============================================================================
 
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
-GOOGLE_API_KEY = os.getenv("GOOGLE_API_KEY")
-DEEPSEEK_API_KEY = os.getenv("DEEPSEEK_API_KEY")
+API_KEY_NAMES = ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY", "DEEPSEEK_API_KEY")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> bool:
+    """Load environment variables from the .env file (once per process)"""
+    from dotenv import load_dotenv
+    return load_dotenv()
+
+
+def __getattr__(name: str):
+    if name in API_KEY_NAMES:
+        _load_env()
+        return os.getenv(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ============================================================================
 # MODEL CONFIGURATIONS
@@ -172,6 +186,64 @@ DIMENSION_DESCRIPTIONS = {
     "indulgence": "Extent to which people try to control desires and impulses",
 }
 
+
+@dataclass(frozen=True, slots=True)
+class CultureSpec:
+    """Read-only view of one CULTURAL_CONTEXTS entry for hot lookups"""
+    name: str
+    location: str
+    description: str
+    hofstede: np.ndarray  # expected scores in CULTURAL_DIMENSIONS order, NaN if unknown
+    has_scores: bool
+
+
+def build_culture_specs(cultural_contexts: Dict[str, Dict]) -> Dict[str, CultureSpec]:
+    """CultureSpec per culture, with Hofstede scores as a read-only array"""
+    specs = {}
+    for culture, context in cultural_contexts.items():
+        scores = context["hofstede_scores"]
+        hofstede = np.array(
+            [np.nan if scores.get(dim) is None else scores[dim] for dim in CULTURAL_DIMENSIONS],
+            dtype=np.float64
+        )
+        hofstede.flags.writeable = False
+        specs[culture] = CultureSpec(
+            name=context["name"],
+            location=context["location"],
+            description=context["description"],
+            hofstede=hofstede,
+            has_scores=any(v is not None for v in scores.values()),
+        )
+    return specs
+
+
+# CULTURAL_CONTEXTS stays the editable source; CULTURES mirrors it for code
+# that reads scores per response
+CULTURES = build_culture_specs(CULTURAL_CONTEXTS)
+
+
+def build_hofstede_matrix(specs: Dict[str, CultureSpec]) -> Tuple[List[str], np.ndarray]:
+    """
+    Expected Hofstede scores as a (culture x dimension) array
+
+    Stacks the CultureSpec score arrays. Rows follow the returned culture
+    list, columns follow CULTURAL_DIMENSIONS. Missing (None) scores are NaN;
+    baseline and cultures without any scores are left out.
+    """
+    cultures = [
+        culture for culture, spec in specs.items()
+        if culture != "baseline" and spec.has_scores
+    ]
+    matrix = np.array(
+        [specs[culture].hofstede for culture in cultures], dtype=np.float64
+    ).reshape(len(cultures), len(CULTURAL_DIMENSIONS))
+    return cultures, matrix
+
+
+# Precomputed once at import for vectorized distance computations
+HOFSTEDE_CULTURES, HOFSTEDE_MATRIX = build_hofstede_matrix(CULTURES)
+DIMENSION_INDEX = {dim: i for i, dim in enumerate(CULTURAL_DIMENSIONS)}
+
 # ============================================================================
 # BALANCED VALUE OPTIONS
 # 3 values per dimension (18 total), balanced across all dimensions
@@ -282,12 +354,52 @@ STEREOTYPE_INDICATORS = [
     "stereotypical", "generally", "usually", "tend to",
 ]
 
+# ============================================================================
+# READ-ONLY VIEWS
+# Shared lookup tables are exposed as read-only mappings, so no caller can
+# mutate them for every other importer (or needs a defensive copy)
+# ============================================================================
+
+def _freeze(value):
+    """Recursively wrap dicts in read-only MappingProxyType views"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
+
+MODELS = _freeze(MODELS)
+CULTURAL_CONTEXTS = _freeze(CULTURAL_CONTEXTS)
+VALUE_DIMENSION_MAPPING = _freeze(VALUE_DIMENSION_MAPPING)
+DECISION_TEMPLATES = _freeze(DECISION_TEMPLATES)
+
+# Key orders, built once for option lists and iteration (membership tests can
+# use the mappings above directly)
+MODEL_KEYS = tuple(MODELS)
+CULTURE_KEYS = tuple(CULTURAL_CONTEXTS)
+
+# Reverse of VALUE_DIMENSION_MAPPING: dimension → its values (mapping order)
+DIMENSION_TO_VALUES = MappingProxyType({
+    dim: tuple(value for value, (value_dim, _) in VALUE_DIMENSION_MAPPING.items() if value_dim == dim)
+    for dim in CULTURAL_DIMENSIONS
+})
+
 # ============================================================================
 # EXPERIMENT SETTINGS
 # ============================================================================
 
 NUM_RUNS_PER_COMBINATION = 1
 ENABLE_CACHE = True
+# Most inferred response profiles kept by the evaluator's LRU profile cache
+# (in memory and in CACHE_DIR); about 110 bytes each on disk
+PROFILE_CACHE_MAX_ENTRIES = 50_000
+# Half-precision sentence-transformer inference (CUDA only); slightly perturbs
+# alignment scores, so off by default for reproducible results
+EMBEDDING_FP16 = False
+# Sentence-transformer used to infer cultural profiles from responses
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+# Sentence-transformer inference backend: "torch", or "onnx" / "openvino"
+# (needs sentence-transformers>=3.2 with the matching extra installed)
+EMBEDDING_BACKEND = "torch"
 
 # ============================================================================
 # VISUALIZATION SETTINGS
@@ -326,21 +438,22 @@ HOFSTEDE_OFFICIAL_SCORES = {
     "UAE": {"PDI": 85, "IDV": 30, "MAS": 50, "UAI": 75, "LTO": 28, "IND": 40},  # Estimated
 }
 
+# Hofstede 0-100 → -2..+2 buckets: a score maps to the value of the first
+# bin edge it is below (scores >= 80 map to the last value)
+HOFSTEDE_SCORE_BINS = np.array([20, 35, 45, 55, 65, 80])
+HOFSTEDE_SCORE_VALUES = np.array([-2.0, -1.5, -1.0, 0.0, 1.0, 1.5, 2.0])
+
+
+def convert_hofstede_scores(scores) -> np.ndarray:
+    """Convert Hofstede 0-100 scores (scalar or array) to the -2 to +2 scale"""
+    return HOFSTEDE_SCORE_VALUES[np.searchsorted(HOFSTEDE_SCORE_BINS, scores, side="right")]
+
+
 def validate_hofstede_conversion():
     """
     Validation function to ensure conversions are correct
     Call this during testing to verify scores
     """
-    def convert_score(score):
-        """Convert Hofstede 0-100 to -2 to +2"""
-        if score < 20: return -2.0
-        elif score < 35: return -1.5
-        elif score < 45: return -1.0
-        elif score < 55: return 0.0
-        elif score < 65: return 1.0
-        elif score < 80: return 1.5
-        else: return 2.0
-
     dimension_map = {
         "PDI": "power_distance",
         "IDV": "individualism",
@@ -350,44 +463,36 @@ def validate_hofstede_conversion():
         "IND": "indulgence",
     }
 
+    # Official, converted and configured scores as (culture x dimension)
+    # arrays, compared in one vectorized check
+    cultures = [culture for culture in HOFSTEDE_OFFICIAL_SCORES if culture != "baseline"]
+    abbrs = list(dimension_map)
+    dim_columns = [DIMENSION_INDEX[dimension_map[abbr]] for abbr in abbrs]
+
+    official = np.array([[HOFSTEDE_OFFICIAL_SCORES[c][abbr] for abbr in abbrs] for c in cultures])
+    converted = convert_hofstede_scores(official)
+    actual = np.stack([CULTURES[c].hofstede[dim_columns] for c in cultures])
+    matches = converted == actual
+
     print("=" * 80)
     print("HOFSTEDE SCORE VALIDATION")
     print("=" * 80)
 
-    for culture, official_scores in HOFSTEDE_OFFICIAL_SCORES.items():
-        if culture == "baseline":
-            continue
-
+    for i, culture in enumerate(cultures):
         print(f"\n{culture}:")
-        config_scores = CULTURAL_CONTEXTS[culture]["hofstede_scores"]
-
-        all_match = True
-        for dim_abbr, official_score in official_scores.items():
-            dim_name = dimension_map[dim_abbr]
-            expected = convert_score(official_score)
-            actual = config_scores[dim_name]
 
-            match = "✓" if expected == actual else "✗"
-            if expected != actual:
-                all_match = False
+        for j, dim_abbr in enumerate(abbrs):
+            print(f"  {dim_abbr} ({dimension_map[dim_abbr]:.<25}): "
+                  f"Official={official[i, j]:>3} → Expected={converted[i, j]:>4.1f}, "
+                  f"Actual={actual[i, j]:>4.1f} {'✓' if matches[i, j] else '✗'}")
 
-            print(f"  {dim_abbr} ({dim_name:.<25}): "
-                  f"Official={official_score:>3} → Expected={expected:>4.1f}, "
-                  f"Actual={actual:>4.1f} {match}")
-
-        print(f"  Status: {'✅ ALL CORRECT' if all_match else '❌ ERRORS FOUND'}")
+        print(f"  Status: {'✅ ALL CORRECT' if matches[i].all() else '❌ ERRORS FOUND'}")
 
     print("\n" + "=" * 80)
 
 
 def validate_value_balance():
     """Validate that VALUE_OPTIONS are balanced across dimensions"""
-    from collections import Counter
-
-    dimensions_count = Counter()
-    for value, (dimension, _) in VALUE_DIMENSION_MAPPING.items():
-        dimensions_count[dimension] += 1
-
     print("\n" + "="*80)
     print("VALUE OPTIONS BALANCE CHECK")
     print("="*80)
@@ -396,7 +501,7 @@ def validate_value_balance():
     is_balanced = True
 
     for dimension in CULTURAL_DIMENSIONS:
-        count = dimensions_count.get(dimension, 0)
+        count = len(DIMENSION_TO_VALUES[dimension])
         status = "✅" if count == target_per_dimension else "❌"
         print(f"{status} {dimension:.<40} {count} values")
         if count != target_per_dimension:
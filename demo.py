@@ -3,6 +3,9 @@ Interactive Demo Application
 Streamlit app for exploring cultural bias in LLMs
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import numpy as np
 import streamlit as st
 import pandas as pd
 import plotly.express as px
@@ -34,6 +37,9 @@ def get_components():
 
 components = get_components()
 
+# Upper bound on simultaneous API requests from one "Generate" click
+MAX_CONCURRENT_CALLS = 8
+
 
 def main():
     st.title("🌍 Cultural Bias in Large Language Models")
@@ -57,16 +63,22 @@ def main():
     # Model selection
     selected_models = st.sidebar.multiselect(
         "Select Models",
-        options=list(config.MODELS.keys()),
+        options=config.MODEL_KEYS,
         default=["gpt-4"]
     )
     
     # Culture selection
     selected_cultures = st.sidebar.multiselect(
         "Select Cultures",
-        options=list(config.CULTURAL_CONTEXTS.keys()),
+        options=config.CULTURE_KEYS,
         default=["baseline", "US", "Japan"]
     )
+
+    # Response cache effectiveness for this session
+    cache_stats = components['llm_interface'].cache_stats
+    st.sidebar.caption(
+        f"Response cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses"
+    )
     
     # Main content
     col1, col2 = st.columns([1, 1])
@@ -104,48 +116,74 @@ def main():
         )
 
 
+@st.cache_data(ttl=3600)
+def build_prompt_cached(scenario_id: str, culture: str) -> tuple:
+    """System and user prompt for a scenario × culture, reused across reruns"""
+    scenario = get_scenario_by_id(scenario_id)
+    return components['prompt_constructor'].build_complete_prompt(scenario, culture)
+
+
+@st.cache_data(ttl=3600)
+def parse_and_evaluate(response_text: str, culture: str, scenario_id: str) -> tuple:
+    """Parsed response and its metrics, reused when the same response comes back"""
+    scenario = get_scenario_by_id(scenario_id)
+    parsed = components['parser'].parse_response(response_text)
+    metrics = components['evaluator'].evaluate_response(
+        parsed, culture, scenario.cultural_dimensions
+    )
+    return parsed, metrics
+
+
 def generate_and_display_responses(scenario, models, cultures, components):
     """Generate and display responses for all combinations"""
     
     st.subheader("🤖 Model Responses")
     
-    results = []
+    pairs = [(model, culture) for model in models for culture in cultures]
+    results_by_pair = {}
     
     # Progress bar
     progress_bar = st.progress(0)
     status_text = st.empty()
+    status_text.text(f"Generating {len(pairs)} responses...")
     
-    total = len(models) * len(cultures)
+    total = len(pairs)
     current = 0
     
-    for model in models:
-        for culture in cultures:
-            status_text.text(f"Generating response for {model} × {culture}...")
+    # API calls are independent and network-bound, so issue them concurrently;
+    # parsing, scoring and all Streamlit updates stay on the script thread
+    with ThreadPoolExecutor(max_workers=min(total, MAX_CONCURRENT_CALLS)) as pool:
+        futures = {}
+        for model, culture in pairs:
+            try:
+                system_prompt, user_prompt = build_prompt_cached(scenario.id, culture)
+            except Exception as e:
+                st.error(f"Error with {model} × {culture}: {str(e)}")
+                current += 1
+                progress_bar.progress(current / total)
+                continue
+            future = pool.submit(
+                components['llm_interface'].call_model, model, system_prompt, user_prompt
+            )
+            futures[future] = (model, culture)
+        
+        for future in as_completed(futures):
+            model, culture = futures[future]
+            status_text.text(f"Received response for {model} × {culture}")
             
             try:
-                # Generate response
-                system_prompt, user_prompt = components['prompt_constructor'].build_complete_prompt(
-                    scenario, culture
-                )
-                response_text = components['llm_interface'].call_model(
-                    model, system_prompt, user_prompt
-                )
+                response_text = future.result()
                 
-                # Parse response
-                parsed = components['parser'].parse_response(response_text)
+                # Parse and evaluate
+                parsed, metrics = parse_and_evaluate(response_text, culture, scenario.id)
                 
-                # Evaluate
-                metrics = components['evaluator'].evaluate_response(
-                    parsed, culture, scenario.cultural_dimensions
-                )
-                
-                results.append({
+                results_by_pair[(model, culture)] = {
                     'model': model,
                     'culture': culture,
                     'response': response_text,
                     'parsed': parsed,
                     'metrics': metrics
-                })
+                }
                 
             except Exception as e:
                 st.error(f"Error with {model} × {culture}: {str(e)}")
@@ -156,17 +194,26 @@ def generate_and_display_responses(scenario, models, cultures, components):
     status_text.text("✅ All responses generated!")
     progress_bar.empty()
     
+    # Persist profiles inferred for this batch of responses
+    components['evaluator'].save_profile_cache()
+    
+    # Keep the model × culture order regardless of completion order
+    results = [results_by_pair[pair] for pair in pairs if pair in results_by_pair]
+    
     # Display results
-    display_results(results, cultures, models)
+    display_results(results, cultures, models, results_by_pair)
 
 
-def display_results(results, cultures, models):
+def display_results(results, cultures, models, results_by_pair=None):
     """Display results in organized tabs"""
     
+    if results_by_pair is None:
+        results_by_pair = {(r['model'], r['culture']): r for r in results}
+    
     tabs = st.tabs(["💬 Responses", "📊 Analysis", "🎯 Metrics"])
     
     with tabs[0]:
-        display_responses_tab(results, cultures, models)
+        display_responses_tab(results_by_pair, cultures, models)
     
     with tabs[1]:
         display_analysis_tab(results)
@@ -175,8 +222,8 @@ def display_results(results, cultures, models):
         display_metrics_tab(results)
 
 
-def display_responses_tab(results, cultures, models):
-    """Display response comparison"""
+def display_responses_tab(results_by_pair, cultures, models):
+    """Display response comparison from a {(model, culture): result} index"""
     st.subheader("Response Comparison")
     
     # Create comparison view
@@ -186,7 +233,7 @@ def display_responses_tab(results, cultures, models):
         cols = st.columns(len(models))
         
         for idx, model in enumerate(models):
-            result = next((r for r in results if r['model'] == model and r['culture'] == culture), None)
+            result = results_by_pair.get((model, culture))
             
             if result:
                 with cols[idx]:
@@ -254,12 +301,12 @@ def display_metrics_tab(results):
     metrics_data = []
     for result in results:
         metrics = result['metrics']
+        alignment = metrics.cultural_alignment_score
         metrics_data.append({
             'Model': result['model'],
             'Culture': result['culture'],
-            'Cultural Alignment': f"{metrics.cultural_alignment_score:.2f}",
-            'Consistency': f"{metrics.consistency_score:.2f}",
-            'Differentiation': f"{metrics.cultural_differentiation_score:.2f}",
+            # Baseline responses have no expected profile, so no alignment
+            'Cultural Alignment': "N/A" if alignment is None else f"{alignment:.2f}",
             'Stereotype Score': f"{metrics.stereotype_score:.2f}"
         })
     
@@ -272,22 +319,26 @@ def display_metrics_tab(results):
         
         fig = go.Figure()
         
-        for model in set(r['model'] for r in results):
-            model_results = [r for r in results if r['model'] == model]
-            
-            metrics = ['cultural_alignment_score', 'consistency_score', 
-                      'cultural_differentiation_score', 'stereotype_score']
-            
-            values = [
-                sum(r['metrics'].cultural_alignment_score for r in model_results) / len(model_results),
-                sum(r['metrics'].consistency_score for r in model_results) / len(model_results),
-                sum(r['metrics'].cultural_differentiation_score for r in model_results) / len(model_results),
-                sum(r['metrics'].stereotype_score for r in model_results) / len(model_results)
-            ]
+        # Group results by model in one pass (first-appearance order)
+        results_by_model = {}
+        for r in results:
+            results_by_model.setdefault(r['model'], []).append(r['metrics'])
+        
+        for model, model_metrics in results_by_model.items():
+            # (responses x metrics) array, averaged per metric in one pass;
+            # missing alignment scores (baseline) are skipped
+            scores = np.array([
+                [np.nan if m.cultural_alignment_score is None else m.cultural_alignment_score,
+                 m.stereotype_score]
+                for m in model_metrics
+            ], dtype=np.float64)
+            known = ~np.isnan(scores)
+            with np.errstate(invalid='ignore'):
+                values = np.where(known, scores, 0.0).sum(axis=0) / known.sum(axis=0)
             
             fig.add_trace(go.Scatterpolar(
-                r=values,
-                theta=['Alignment', 'Consistency', 'Differentiation', 'Low Stereotypes'],
+                r=values.tolist(),
+                theta=['Alignment', 'Low Stereotypes'],
                 fill='toself',
                 name=model
             ))
@@ -8,11 +8,16 @@ Complete semantic exemplars for all 6 Hofstede dimensions:
 - Balanced representation across all dimensions
 """
 
+import functools
+import hashlib
+import json
 import numpy as np
+from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 import logging
-from collections import Counter
+from collections import Counter, OrderedDict
+import torch
 from sentence_transformers import SentenceTransformer, util
 
 from config import CULTURAL_CONTEXTS, CULTURAL_DIMENSIONS, STEREOTYPE_INDICATORS
@@ -22,14 +27,18 @@ import config
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EvaluationMetrics:
     """Container for all evaluation metrics"""
     cultural_alignment_score: Optional[float]
     stereotype_score: float
 
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Flat record: a literal dict skips asdict's recursive copy
+        return {
+            'cultural_alignment_score': self.cultural_alignment_score,
+            'stereotype_score': self.stereotype_score,
+        }
 
 
 class CulturalEvaluator:
@@ -40,15 +49,50 @@ class CulturalEvaluator:
     FIXED: Complete exemplars for all 6 dimensions with no VALUE_OPTIONS overlap.
     """
 
-    def __init__(self):
-        """Initialize evaluator with semantic model"""
+    # Bump when the profile scoring changes so stale cached profiles are ignored
+    PROFILE_CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        use_fp16: Optional[bool] = None,
+        backend: Optional[str] = None,
+        use_cache: Optional[bool] = None
+    ):
+        """
+        Initialize evaluator with semantic model
+
+        Args:
+            use_fp16: Run the sentence-transformer in half precision when a
+                CUDA device is available (torch backend only); defaults to
+                config.EMBEDDING_FP16
+            backend: Sentence-transformer backend ("torch", "onnx", "openvino");
+                defaults to config.EMBEDDING_BACKEND
+            use_cache: Load and save inferred profiles in CACHE_DIR; defaults
+                to config.ENABLE_CACHE
+        """
+        if use_fp16 is None:
+            use_fp16 = config.EMBEDDING_FP16
+        if backend is None:
+            backend = config.EMBEDDING_BACKEND
+        if use_cache is None:
+            use_cache = config.ENABLE_CACHE
+
         self.dimensions = CULTURAL_DIMENSIONS
         self.logger = logging.getLogger(__name__)
         self.stereotype_indicators = STEREOTYPE_INDICATORS
         self.cultural_contexts = CULTURAL_CONTEXTS
 
         self.logger.info("Loading semantic similarity model...")
-        self.semantic_model = SentenceTransformer('all-MiniLM-L6-v2')
+        # Only pass backend when non-default, so older sentence-transformers
+        # releases without the argument keep working
+        model_kwargs = {} if backend == "torch" else {"backend": backend}
+        self.semantic_model = SentenceTransformer(config.EMBEDDING_MODEL, **model_kwargs)
+        fp16 = use_fp16 and backend == "torch" and torch.cuda.is_available()
+        if fp16:
+            # Exemplars below are encoded after the cast, so both sides of
+            # every similarity share the same precision
+            self.semantic_model = self.semantic_model.to('cuda').half()
+            self.logger.info("Semantic model running in FP16 on CUDA")
 
         # ====================================================================
         # REDESIGNED CULTURAL DIMENSION EXEMPLARS
@@ -161,14 +205,43 @@ class CulturalEvaluator:
             }
         }
 
-        # Pre-encode exemplars for efficiency
+        # Pre-encode exemplars for efficiency: all dimensions and poles in one
+        # batched encode call, then sliced back per pole into pole_centroids
         self.logger.info("Pre-encoding cultural exemplars...")
-        self.encoded_exemplars = {}
+        flat_exemplars = []
+        exemplar_slices = {}
         for dim, poles in self.dimension_exemplars.items():
-            self.encoded_exemplars[dim] = {
-                'high': self.semantic_model.encode(poles['high'], convert_to_tensor=True),
-                'low': self.semantic_model.encode(poles['low'], convert_to_tensor=True)
-            }
+            for pole in ('high', 'low'):
+                start = len(flat_exemplars)
+                flat_exemplars.extend(poles[pole])
+                exemplar_slices[dim, pole] = slice(start, len(flat_exemplars))
+
+        embeddings = self.semantic_model.encode(
+            flat_exemplars,
+            batch_size=64,
+            convert_to_tensor=True,
+            show_progress_bar=False
+        )
+        # Mean of a response's cosine similarities to a pole's exemplars equals
+        # its dot product with the mean of the unit-length exemplars, so one
+        # (embedding_dim, 2 * n_dimensions) matrix scores every pole at once:
+        # high poles first, then low poles, each in self.dimensions order
+        exemplar_matrix = util.normalize_embeddings(embeddings)
+        self.pole_centroids = torch.stack([
+            exemplar_matrix[exemplar_slices[dim, pole]].mean(dim=0)
+            for pole in ('high', 'low')
+            for dim in self.dimensions
+        ], dim=1)
+        # Inferred profiles keyed by a digest of the embedded response text,
+        # least recently used first; identical responses recur across runs,
+        # models and analysis passes
+        self._profile_cache: OrderedDict[str, Dict[str, float]] = OrderedDict()
+        self._profile_cache_file = (
+            self._get_profile_cache_file(backend, fp16) if use_cache else None
+        )
+        self._profile_cache_dirty = False
+        self._load_profile_cache()
+
         self.logger.info("Cultural evaluator initialized with complete 6-dimension coverage")
 
     def calculate_cultural_alignment(
@@ -196,50 +269,38 @@ class CulturalEvaluator:
             logger.debug("Baseline has no expected cultural alignment - returning None")
             return None
 
-        if culture not in self.cultural_contexts:
+        spec = config.CULTURES.get(culture)
+        if spec is None:
             logger.warning(f"Unknown culture: {culture}")
             return 0.0
 
-        expected_profile = self.cultural_contexts[culture]['hofstede_scores']
-
-        if all(v is None for v in expected_profile.values()):
+        if not spec.has_scores:
             logger.warning(f"Culture {culture} has no Hofstede scores defined")
             return None
 
         response_profile = self._infer_cultural_profile(parsed_response)
 
-        distances = []
-        for dim in scenario_dimensions:
-            if dim in expected_profile and dim in response_profile:
-                expected = expected_profile[dim]
-                actual = response_profile[dim]
+        # Expected vs. inferred scores for the scenario's dimensions as arrays
+        dims = [
+            dim for dim in scenario_dimensions
+            if dim in config.DIMENSION_INDEX and dim in response_profile
+        ]
+        expected = spec.hofstede[[config.DIMENSION_INDEX[dim] for dim in dims]]
+        actual = np.array([response_profile[dim] for dim in dims], dtype=np.float64)
+        known = ~np.isnan(expected)
 
-                if expected is None:
-                    continue
-
-                distances.append((expected - actual) ** 2)
-
-        if not distances:
+        if not known.any():
             logger.warning(f"No valid dimensions to compare for {culture}")
             return 5.0
 
-        euclidean_distance = np.sqrt(np.mean(distances))
+        euclidean_distance = np.sqrt(np.mean((expected[known] - actual[known]) ** 2))
         alignment_score = max(0, 10 - (euclidean_distance * 2.5))
 
         return alignment_score
 
-    def _infer_cultural_profile(self, parsed_response: ParsedResponse) -> Dict[str, float]:
-        """
-        Infer cultural dimension scores from response using semantic similarity
-
-        Args:
-            parsed_response: Parsed response
-
-        Returns:
-            Dictionary of dimension scores on -2 to +2 scale
-        """
-        profile = {}
-
+    @staticmethod
+    def _profile_text(parsed_response: ParsedResponse) -> str:
+        """Value-centric text embedded for a response's cultural profile"""
         # --- NEW: build a value-centric text for embedding ---
         # Safely get fields
         explanation = parsed_response.explanation or ""
@@ -254,42 +315,182 @@ class CulturalEvaluator:
         boosted_values = " ".join([values_text] * 3) if values_text else ""
 
         # Combine boosted values with full explanation + decision
-        response_text = f"{boosted_values} {explanation} {decision}".strip()
         # --- END NEW ---
+        return f"{boosted_values} {explanation} {decision}".strip()
 
-        if not response_text:
-            self.logger.warning("Empty response text, returning neutral profile")
-            return {dim: 0.0 for dim in self.dimensions}
+    def _profiles_from_embeddings(self, embeddings) -> List[Dict[str, float]]:
+        """
+        Dimension scores (-2 to +2) for a batch of response embeddings
 
-        response_embedding = self.semantic_model.encode(
-            response_text,
+        Args:
+            embeddings: Tensor of shape (n_responses, embedding_dim)
+
+        Returns:
+            One profile dictionary per embedding
+        """
+        # Mean similarity of every response to every pole in one matmul
+        pole_means = (
+            util.normalize_embeddings(embeddings) @ self.pole_centroids
+        ).float().cpu().numpy().astype(np.float64)
+        avg_high, avg_low = np.split(pole_means, 2, axis=1)
+
+        # All (n_responses, n_dimensions) scores in one expression
+        similarity_sum = avg_high + avg_low
+        positive = similarity_sum > 0
+        ratio = np.divide(avg_high - avg_low, similarity_sum,
+                          out=np.zeros_like(similarity_sum), where=positive)
+        scores = np.clip(np.where(positive, np.tanh(ratio) * 2.0, 0.0), -2.0, 2.0)
+
+        return [dict(zip(self.dimensions, row)) for row in scores.tolist()]
+
+    def _get_profile_cache_file(self, backend: str, fp16: bool) -> Path:
+        """
+        On-disk profile cache path for this model configuration
+
+        Keyed on the model, backend, precision, exemplar sentences and
+        PROFILE_CACHE_VERSION, so changing any of them starts a fresh cache.
+        """
+        parts = [
+            config.EMBEDDING_MODEL, backend, str(fp16),
+            json.dumps(self.dimension_exemplars, sort_keys=True),
+            str(self.PROFILE_CACHE_VERSION),
+        ]
+        key = hashlib.blake2b('\0'.join(parts).encode(), digest_size=8).hexdigest()
+        return config.CACHE_DIR / f"profiles_{key}.json"
+
+    def _load_profile_cache(self):
+        """Load profiles stored by earlier runs"""
+        if self._profile_cache_file is None or not self._profile_cache_file.exists():
+            return
+        try:
+            with open(self._profile_cache_file, 'r') as f:
+                stored = json.load(f)
+            self._profile_cache.update(
+                (key, dict(zip(self.dimensions, scores))) for key, scores in stored.items()
+            )
+            self._trim_profile_cache()
+            self.logger.info(f"Loaded {len(stored)} cached profiles")
+        except Exception as e:
+            self.logger.warning(f"Error reading profile cache: {e}")
+
+    def _trim_profile_cache(self):
+        """Drop least recently used profiles beyond PROFILE_CACHE_MAX_ENTRIES"""
+        while len(self._profile_cache) > config.PROFILE_CACHE_MAX_ENTRIES:
+            self._profile_cache.popitem(last=False)
+
+    def save_profile_cache(self):
+        """
+        Write the profile cache to CACHE_DIR if profiles were added since the
+        last save
+
+        The file holds at most PROFILE_CACHE_MAX_ENTRIES profiles (the most
+        recently used) and is rewritten in full on each save.
+        """
+        if self._profile_cache_file is None or not self._profile_cache_dirty:
+            return
+        stored = {
+            key: [profile[dim] for dim in self.dimensions]
+            for key, profile in self._profile_cache.items()
+        }
+        try:
+            tmp_file = self._profile_cache_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                json.dump(stored, f)
+            tmp_file.replace(self._profile_cache_file)
+            self._profile_cache_dirty = False
+        except Exception as e:
+            self.logger.warning(f"Error saving profile cache: {e}")
+
+    @staticmethod
+    def _profile_key(text: str) -> str:
+        """Profile cache key for an embedded text"""
+        return hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+
+    def precompute_profiles(self, parsed_responses, batch_size: int = 32):
+        """
+        Embed the responses not yet profiled in batched encode calls
+
+        Later _infer_cultural_profile calls for these responses are cache
+        hits, so a loop over many responses pays for batched inference
+        instead of one model call per response. New profiles are saved to
+        the on-disk cache after the batch.
+
+        Args:
+            parsed_responses: Iterable of ParsedResponse
+            batch_size: Sentence-transformer batch size
+        """
+        pending = {}
+        for text in map(self._profile_text, parsed_responses):
+            if text:
+                key = self._profile_key(text)
+                if key in self._profile_cache:
+                    self._profile_cache.move_to_end(key)
+                else:
+                    pending[key] = text
+        if not pending:
+            self.save_profile_cache()
+            return
+
+        embeddings = self.semantic_model.encode(
+            list(pending.values()),
+            batch_size=batch_size,
             convert_to_tensor=True
         )
+        self._profile_cache.update(zip(pending, self._profiles_from_embeddings(embeddings)))
+        self._trim_profile_cache()
+        self._profile_cache_dirty = True
+        self.save_profile_cache()
 
-        for dim in self.dimensions:
-            high_similarities = util.cos_sim(
-                response_embedding,
-                self.encoded_exemplars[dim]['high']
-            )[0]
-            low_similarities = util.cos_sim(
-                response_embedding,
-                self.encoded_exemplars[dim]['low']
-            )[0]
+    def _infer_cultural_profiles(self, parsed_responses: List[ParsedResponse]) -> np.ndarray:
+        """
+        Cultural profiles of many responses from batched encoding
 
-            avg_high = float(high_similarities.mean())
-            avg_low = float(low_similarities.mean())
+        Args:
+            parsed_responses: Parsed responses
+
+        Returns:
+            Array of shape (n_responses, n_dimensions), columns in
+            CULTURAL_DIMENSIONS order, scores on -2 to +2 scale
+        """
+        self.precompute_profiles(parsed_responses)
+        profiles = [self._infer_cultural_profile(resp) for resp in parsed_responses]
+        return np.array(
+            [[profile[dim] for dim in self.dimensions] for profile in profiles],
+            dtype=np.float64
+        ).reshape(len(profiles), len(self.dimensions))
+
+    def _infer_cultural_profile(self, parsed_response: ParsedResponse) -> Dict[str, float]:
+        """
+        Infer cultural dimension scores from response using semantic similarity
 
-            similarity_sum = avg_high + avg_low
+        Args:
+            parsed_response: Parsed response
 
-            if similarity_sum > 0:
-                similarity_diff = avg_high - avg_low
-                score = np.tanh(similarity_diff / similarity_sum) * 2.0
-            else:
-                score = 0.0
+        Returns:
+            Dictionary of dimension scores on -2 to +2 scale
+        """
+        response_text = self._profile_text(parsed_response)
 
-            profile[dim] = float(np.clip(score, -2.0, 2.0))
+        if not response_text:
+            self.logger.warning("Empty response text, returning neutral profile")
+            return {dim: 0.0 for dim in self.dimensions}
 
-        return profile
+        key = self._profile_key(response_text)
+        cached = self._profile_cache.get(key)
+        if cached is not None:
+            self._profile_cache.move_to_end(key)
+            return dict(cached)
+
+        response_embedding = self.semantic_model.encode(
+            [response_text],
+            convert_to_tensor=True
+        )
+        profile = self._profiles_from_embeddings(response_embedding)[0]
+
+        self._profile_cache[key] = profile
+        self._trim_profile_cache()
+        self._profile_cache_dirty = True
+        return dict(profile)
 
     def calculate_stereotype_score(self, parsed_response: ParsedResponse) -> float:
         """Calculate stereotype usage in response"""
@@ -336,32 +537,50 @@ def aggregate_metrics(metrics_list: List[EvaluationMetrics]) -> Dict:
             'mean_stereotype': 0.0
         }
 
+    # One pass over the metrics; baseline alignment (None) becomes NaN
+    scores = np.array([
+        (np.nan if m.cultural_alignment_score is None else m.cultural_alignment_score,
+         m.stereotype_score)
+        for m in metrics_list
+    ], dtype=np.float64)
+    alignment = scores[:, 0][~np.isnan(scores[:, 0])]
+
     aggregated = {
-        'mean_alignment': np.mean([m.cultural_alignment_score for m in metrics_list
-                                   if m.cultural_alignment_score is not None]),
-        'std_alignment': np.std([m.cultural_alignment_score for m in metrics_list
-                                 if m.cultural_alignment_score is not None]),
-        'mean_stereotype': np.mean([m.stereotype_score for m in metrics_list])
+        'mean_alignment': alignment.mean() if alignment.size else np.nan,
+        'std_alignment': alignment.std() if alignment.size else np.nan,
+        'mean_stereotype': scores[:, 1].mean()
     }
 
     return aggregated
 
 
+@functools.lru_cache(maxsize=1)
+def _get_default_evaluator() -> CulturalEvaluator:
+    """Evaluator shared by calls that are not given one (loads the model once)"""
+    return CulturalEvaluator()
+
+
 def calculate_baseline_bias(
         baseline_responses: List[tuple],  # ← Now (ParsedResponse, scenario_id) tuples
         cultural_contexts: Dict[str, Dict],
+        evaluator: Optional[CulturalEvaluator] = None,
 ) -> Dict[str, float]:
     """
     Calculate which culture the baseline responses are closest to
     This reveals the inherent cultural bias in the model
 
     Now uses primary_decision_dimension per scenario for consistency with alignment scoring
+
+    Pass the caller's evaluator to reuse its loaded model and profile cache.
     """
     from scenarios import get_scenario_by_id
-    evaluator = CulturalEvaluator()
+    if evaluator is None:
+        evaluator = _get_default_evaluator()
 
-    # Step 1: Infer profile AND get primary dimension for each response
-    baseline_data = []
+    # Step 1: Get primary dimension for each response, then infer all
+    # profiles in one batch and keep only the primary-dimension scores
+    responses = []
+    primary_dims = []
     for resp, scenario_id in baseline_responses:  # ← Unpack tuple
         if not resp.parse_success:
             continue
@@ -370,46 +589,42 @@ def calculate_baseline_bias(
         if not scenario:
             continue
 
-        profile = evaluator._infer_cultural_profile(resp)
         primary_dim = scenario.primary_decision_dimension  # ← Get primary dimension
 
-        baseline_data.append({
-            'profile': profile,
-            'primary_dimension': primary_dim  # ← Store with response
-        })
+        responses.append(resp)
+        primary_dims.append(config.DIMENSION_INDEX.get(primary_dim, -1))
 
-    if not baseline_data:
+    if not responses:
         return {}
 
-    # Step 2: Calculate distances to each culture
-    distances = {}
-    for culture, context in cultural_contexts.items():
-        if culture == "baseline":
-            continue
-
-        expected_profile = context['hofstede_scores']
-
-        if all(v is None for v in expected_profile.values()):
-            continue
-
-        # Step 3: Use ONLY primary dimension for each response
-        dist_squared = []
-        for item in baseline_data:  # ← Loop through responses
-            dim = item['primary_dimension']  # ← Get THIS scenario's primary dimension
-
-            if dim in expected_profile and dim in item['profile']:
-                expected = expected_profile[dim]
-
-                if expected is None:
-                    continue
-
-                diff = expected - item['profile'][dim]  # ← Compare only this dimension
-                dist_squared.append(diff ** 2)
-
-        if dist_squared:
-            distances[culture] = np.sqrt(np.mean(dist_squared))
+    # Step 2: Calculate distances to each culture, using ONLY the primary
+    # dimension of each response - one (culture x response) difference matrix
+    if cultural_contexts is config.CULTURAL_CONTEXTS:
+        cultures, hofstede = config.HOFSTEDE_CULTURES, config.HOFSTEDE_MATRIX
+    else:
+        cultures, hofstede = config.build_hofstede_matrix(
+            config.build_culture_specs(cultural_contexts)
+        )
 
-    return distances
+    dim_cols = np.asarray(primary_dims)
+    known = dim_cols >= 0
+    profiles = evaluator._infer_cultural_profiles(responses)
+    actual = profiles[np.flatnonzero(known), dim_cols[known]]
+    diffs = hofstede[:, dim_cols[known]] - actual
+    valid = ~np.isnan(diffs)
+
+    # Root-mean-square over each culture's valid responses in one masked
+    # reduction; cultures with no valid response are left out
+    counts = valid.sum(axis=1)
+    squared = np.where(valid, diffs, 0.0) ** 2
+    with np.errstate(invalid='ignore', divide='ignore'):
+        rms = np.sqrt(squared.sum(axis=1) / counts)
+
+    return {
+        culture: rms[i]
+        for i, culture in enumerate(cultures)
+        if counts[i]
+    }
 
 
 if __name__ == "__main__":
@@ -6,6 +6,7 @@ Handles API calls to different LLM providers (OpenAI, Anthropic, Google)
 import json
 import time
 import hashlib
+import threading
 from typing import Optional
 from pathlib import Path
 import logging
@@ -27,69 +28,114 @@ class LLMInterface:
         self.cache_dir = cache_dir
         self.cache_enabled = config.ENABLE_CACHE
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Responses already read from or written to disk this session
+        self._memory_cache = {}
+        self.cache_stats = {'hits': 0, 'misses': 0}
         
-        # Initialize API clients (lazy loading)
+        # Initialize API clients (lazy loading). Each client keeps its own
+        # connection pool, so concurrent first calls must share one instance
         self._openai_client = None
         self._anthropic_client = None
         self._google_client = None
+        self._deepseek_client = None
+        self._client_lock = threading.Lock()
     
     def _get_openai_client(self):
         """Lazy load OpenAI client"""
         if self._openai_client is None:
-            try:
-                from openai import OpenAI
-                self._openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
-            except ImportError:
-                logger.error("OpenAI package not installed. Run: pip install openai")
-                raise
+            with self._client_lock:
+                if self._openai_client is None:
+                    try:
+                        from openai import OpenAI
+                        self._openai_client = OpenAI(api_key=config.OPENAI_API_KEY)
+                    except ImportError:
+                        logger.error("OpenAI package not installed. Run: pip install openai")
+                        raise
         return self._openai_client
     
     def _get_anthropic_client(self):
         """Lazy load Anthropic client"""
         if self._anthropic_client is None:
-            try:
-                from anthropic import Anthropic
-                self._anthropic_client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
-            except ImportError:
-                logger.error("Anthropic package not installed. Run: pip install anthropic")
-                raise
+            with self._client_lock:
+                if self._anthropic_client is None:
+                    try:
+                        from anthropic import Anthropic
+                        self._anthropic_client = Anthropic(api_key=config.ANTHROPIC_API_KEY)
+                    except ImportError:
+                        logger.error("Anthropic package not installed. Run: pip install anthropic")
+                        raise
         return self._anthropic_client
     
     def _get_google_client(self):
         """Lazy load Google client"""
         if self._google_client is None:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=config.GOOGLE_API_KEY)
-                self._google_client = genai
-            except ImportError:
-                logger.error("Google AI package not installed. Run: pip install google-generativeai")
-                raise
+            with self._client_lock:
+                if self._google_client is None:
+                    try:
+                        import google.generativeai as genai
+                        genai.configure(api_key=config.GOOGLE_API_KEY)
+                        self._google_client = genai
+                    except ImportError:
+                        logger.error("Google AI package not installed. Run: pip install google-generativeai")
+                        raise
         return self._google_client
 
     def _get_deepseek_client(self):
         """Lazy load DeepSeek client (uses OpenAI SDK)"""
-        if not hasattr(self, '_deepseek_client') or self._deepseek_client is None:
-            try:
-                from openai import OpenAI
-                self._deepseek_client = OpenAI(
-                    api_key=config.DEEPSEEK_API_KEY,
-                    base_url="https://api.deepseek.com"
-                )
-            except ImportError:
-                logger.error("OpenAI package not installed. Run: pip install openai")
-                raise
+        if self._deepseek_client is None:
+            with self._client_lock:
+                if self._deepseek_client is None:
+                    try:
+                        from openai import OpenAI
+                        self._deepseek_client = OpenAI(
+                            api_key=config.DEEPSEEK_API_KEY,
+                            base_url="https://api.deepseek.com"
+                        )
+                    except ImportError:
+                        logger.error("OpenAI package not installed. Run: pip install openai")
+                        raise
         return self._deepseek_client
     
-    def _get_cache_key(self, model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
-        """Generate cache key for a prompt"""
+    def _get_cache_key(
+        self,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """Generate cache key for a prompt and its generation settings"""
+        content = json.dumps({
+            'model': model,
+            'system': system_prompt,
+            'user': user_prompt,
+            'temperature': temperature,
+            'max_tokens': max_tokens,
+        }, sort_keys=True)
+        return hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+
+    @staticmethod
+    def _get_legacy_cache_key(model: str, system_prompt: str, user_prompt: str, temperature: float) -> str:
+        """Cache key used by earlier versions (no max_tokens); read-only fallback"""
         content = f"{model}|{system_prompt}|{user_prompt}|{temperature}"
         return hashlib.md5(content.encode()).hexdigest()
     
-    def _get_cached_response(self, cache_key: str) -> Optional[str]:
-        """Retrieve cached response if available"""
+    def _get_cached_response(self, cache_key: str, legacy_key: Optional[str] = None) -> Optional[str]:
+        """
+        Retrieve cached response if available
+
+        Responses cached under the legacy key by earlier runs are still
+        served, and copied to the current key on first use; the legacy file
+        is kept.
+        """
         if not self.cache_enabled:
             return None
+
+        # Repeated prompts in one session (e.g. Streamlit reruns) skip the disk
+        if cache_key in self._memory_cache:
+            self.cache_stats['hits'] += 1
+            return self._memory_cache[cache_key]
         
         cache_file = self.cache_dir / f"{cache_key}.json"
         if cache_file.exists():
@@ -97,15 +143,32 @@ class LLMInterface:
                 with open(cache_file, 'r') as f:
                     data = json.load(f)
                 logger.info(f"Cache hit for key: {cache_key[:8]}...")
+                self._memory_cache[cache_key] = data['response']
+                self.cache_stats['hits'] += 1
                 return data['response']
             except Exception as e:
                 logger.warning(f"Error reading cache: {e}")
+
+        legacy_file = self.cache_dir / f"{legacy_key}.json" if legacy_key else None
+        if legacy_file is not None and legacy_file.exists():
+            try:
+                with open(legacy_file, 'r') as f:
+                    data = json.load(f)
+                logger.info(f"Cache hit for legacy key: {legacy_key[:8]}...")
+                self._save_to_cache(cache_key, data['response'])
+                self.cache_stats['hits'] += 1
+                return data['response']
+            except Exception as e:
+                logger.warning(f"Error reading cache: {e}")
+        self.cache_stats['misses'] += 1
         return None
     
     def _save_to_cache(self, cache_key: str, response: str):
         """Save response to cache"""
         if not self.cache_enabled:
             return
+
+        self._memory_cache[cache_key] = response
         
         cache_file = self.cache_dir / f"{cache_key}.json"
         try:
@@ -126,8 +189,11 @@ class LLMInterface:
         client = self._get_openai_client()
         
         # Check cache
-        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature)
-        cached = self._get_cached_response(cache_key)
+        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature, max_tokens)
+        cached = self._get_cached_response(
+            cache_key,
+            self._get_legacy_cache_key(model_name, system_prompt, user_prompt, temperature)
+        )
         if cached:
             return cached
         
@@ -164,8 +230,11 @@ class LLMInterface:
         client = self._get_anthropic_client()
         
         # Check cache
-        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature)
-        cached = self._get_cached_response(cache_key)
+        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature, max_tokens)
+        cached = self._get_cached_response(
+            cache_key,
+            self._get_legacy_cache_key(model_name, system_prompt, user_prompt, temperature)
+        )
         if cached:
             return cached
         
@@ -202,8 +271,11 @@ class LLMInterface:
         genai = self._get_google_client()
         
         # Check cache
-        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature)
-        cached = self._get_cached_response(cache_key)
+        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature, max_tokens)
+        cached = self._get_cached_response(
+            cache_key,
+            self._get_legacy_cache_key(model_name, system_prompt, user_prompt, temperature)
+        )
         if cached:
             return cached
         
@@ -243,8 +315,11 @@ class LLMInterface:
         client = self._get_deepseek_client()
 
         # Check cache
-        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature)
-        cached = self._get_cached_response(cache_key)
+        cache_key = self._get_cache_key(model_name, system_prompt, user_prompt, temperature, max_tokens)
+        cached = self._get_cached_response(
+            cache_key,
+            self._get_legacy_cache_key(model_name, system_prompt, user_prompt, temperature)
+        )
         if cached:
             return cached
 
@@ -52,12 +52,12 @@ class ExperimentRunner:
             include_baseline: Whether to include baseline (no cultural context) testing
         """
         self.scenarios = scenarios or [s.id for s in ALL_SCENARIOS]
-        self.models = models or list(config.MODELS.keys())
+        self.models = models or list(config.MODEL_KEYS)
         
         # Handle cultures
         if cultures is None:
             # Default: all cultures except baseline
-            cultures = [c for c in config.CULTURAL_CONTEXTS.keys() if c != "baseline"]
+            cultures = [c for c in config.CULTURE_KEYS if c != "baseline"]
         
         # Add baseline if requested
         if include_baseline and "baseline" not in cultures:
@@ -188,14 +188,36 @@ class ExperimentRunner:
             json.dump(self.results, f, indent=2)
         logger.info(f"Saved results to {json_file}")
         
-        # Save as CSV
+        # Save as CSV (list columns as JSON arrays so they load back with json.loads)
         df = pd.DataFrame(self.results)
         csv_file = config.RESULTS_DIR / f"results_{timestamp}.csv"
-        df.to_csv(csv_file, index=False)
+        df.assign(**{
+            col: df[col].map(json.dumps) for col in ('top_values', 'parse_errors') if col in df.columns
+        }).to_csv(csv_file, index=False)
         logger.info(f"Saved results to {csv_file}")
         
+        # Save as Parquet (typed columns, lists kept as lists) when pyarrow is installed
+        self._save_parquet(df, timestamp)
+        
         # Save summary statistics
         self._save_summary_stats(df, timestamp)
+        
+        # Persist profiles inferred while evaluating, so analyze.py reuses them
+        self.evaluator.save_profile_cache()
+
+    def _save_parquet(self, df: pd.DataFrame, timestamp: str):
+        """Save results as Parquet, the compact format analyze.py reads fastest"""
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            logger.info("pyarrow not installed; skipping Parquet output")
+            return
+        
+        # Parquet dictionary-encodes the repeated model/culture/scenario
+        # labels and stores top_values / parse_errors as native lists
+        parquet_file = config.RESULTS_DIR / f"results_{timestamp}.parquet"
+        df.to_parquet(parquet_file, index=False)
+        logger.info(f"Saved results to {parquet_file}")
 
     def _save_summary_stats(self, df: pd.DataFrame, timestamp: str):
         """Save summary statistics"""
@@ -258,22 +280,29 @@ class ExperimentRunner:
             from evaluator import calculate_baseline_bias
             from response_parser import ParsedResponse
 
-            baseline_responses = []
-            for _, row in baseline_data.iterrows():
-                parsed = ParsedResponse(
-                    raw_text=row['raw_response'],
-                    explanation=row['explanation'],
-                    decision=row.get('decision'),
-                    top_values=row.get('top_values', []),
-                    parse_success=row['parse_success'],
-                    parse_errors=[]
+            # top_values are still the parsed lists here; build the tuples
+            # from the column arrays rather than one Series per row
+            cols = ('raw_response', 'explanation', 'decision', 'top_values', 'parse_success', 'scenario_id')
+            baseline_responses = [
+                (
+                    ParsedResponse(
+                        raw_text=raw,
+                        explanation=expl,
+                        decision=dec,
+                        top_values=tv if isinstance(tv, list) else [],
+                        parse_success=ok,
+                        parse_errors=[]
+                    ),
+                    sid
                 )
-                baseline_responses.append((parsed, row['scenario_id']))
+                for raw, expl, dec, tv, ok, sid in zip(*(baseline_data[c].to_numpy() for c in cols))
+            ]
 
             if baseline_responses:
                 baseline_distances = calculate_baseline_bias(
                     baseline_responses,
-                    config.CULTURAL_CONTEXTS
+                    config.CULTURAL_CONTEXTS,
+                    evaluator=self.evaluator
                 )
                 
                 # Find closest culture
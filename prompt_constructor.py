@@ -9,6 +9,9 @@ from typing import Tuple
 from scenarios import Scenario
 from config import CULTURAL_CONTEXTS, VALUE_OPTIONS
 
+# VALUE_OPTIONS formatted for display; identical in every user prompt
+VALUES_FORMATTED = "\n".join([f"  - {value}" for value in VALUE_OPTIONS])
+
 
 class PromptConstructor:
     """Constructs culturally-informed prompts for scenarios"""
@@ -53,9 +56,7 @@ When responding to dilemmas, you naturally consider the cultural context and val
             User prompt string with scenario and response structure
         """
         scenario_text = scenario.get_prompt_text()
-
-        # Format VALUE_OPTIONS nicely for display
-        values_formatted = "\n".join([f"  - {value}" for value in VALUE_OPTIONS])
+        values_formatted = VALUES_FORMATTED
 
         user_prompt = f"""{scenario_text}
 
@@ -191,6 +191,81 @@ def test_evaluation():
         return False
 
 
+def test_statistics():
+    """Test the grouped ANOVA and pairwise t-tests in analyze.py against scipy"""
+    print("\nTesting statistics...")
+
+    import numpy as np
+    import pandas as pd
+    from scipy import stats
+    from analyze import _one_way_anova, _pairwise_t_tests
+
+    rng = np.random.default_rng(0)
+    frames = {
+        "random groups": pd.DataFrame({
+            'model': np.repeat(['a', 'b', 'c', 'd'], [30, 25, 40, 5]),
+            'score': rng.normal(5.0, 2.0, 100),
+        }),
+        "one-element group": pd.DataFrame({
+            'model': ['a', 'b', 'b', 'b', 'c', 'c'],
+            'score': [3.0, 1.0, 2.0, 4.0, 5.0, 6.0],
+        }),
+        "NaN in one group": pd.DataFrame({
+            'model': ['a', 'a', 'a', 'b', 'b', 'b', 'c', 'c'],
+            'score': [1.0, np.nan, 2.0, 4.0, 5.0, 3.0, 7.0, 6.0],
+        }),
+    }
+
+    for name, df in frames.items():
+        groups = [df.loc[df['model'] == m, 'score'].to_numpy() for m in df['model'].unique()]
+
+        labels, (f_stat,), (p_value,) = _one_way_anova(df, 'model', ['score'])
+        expected = stats.f_oneway(*groups)
+        np.testing.assert_allclose([f_stat, p_value], [expected.statistic, expected.pvalue],
+                                   rtol=1e-10, equal_nan=True)
+        print(f"✓ ANOVA matches scipy ({name})")
+
+        _, t_stats, p_values, _ = _pairwise_t_tests(df, 'model', 'score', labels)
+        pair_i, pair_j = np.triu_indices(len(labels), k=1)
+        for i, j, t_stat, p in zip(pair_i, pair_j, t_stats, p_values):
+            expected = stats.ttest_ind(groups[i], groups[j])
+            np.testing.assert_allclose([t_stat, p], [expected.statistic, expected.pvalue],
+                                       rtol=1e-10, equal_nan=True)
+        print(f"✓ Pairwise t-tests match scipy ({name})")
+
+    print("\n✅ Statistics tests passed!")
+    return True
+
+
+def test_hofstede_conversion():
+    """Test the bucketed Hofstede score conversion against the reference chain"""
+    print("\nTesting Hofstede conversion...")
+
+    import numpy as np
+    import config
+
+    def convert_score(score):
+        """Reference 0-100 → -2..+2 conversion"""
+        if score < 20: return -2.0
+        elif score < 35: return -1.5
+        elif score < 45: return -1.0
+        elif score < 55: return 0.0
+        elif score < 65: return 1.0
+        elif score < 80: return 1.5
+        else: return 2.0
+
+    scores = np.arange(0.0, 100.5, 0.5)
+    expected = [convert_score(score) for score in scores]
+    assert list(config.convert_hofstede_scores(scores)) == expected, "Array conversion differs"
+    assert all(
+        config.convert_hofstede_scores(score) == convert_score(score) for score in scores
+    ), "Scalar conversion differs"
+    print(f"✓ Conversion matches on {len(scores)} scores from 0 to 100")
+
+    print("\n✅ Hofstede conversion tests passed!")
+    return True
+
+
 def test_api_keys():
     """Test if API keys are configured"""
     print("\nChecking API keys...")
@@ -244,6 +319,8 @@ def run_all_tests():
         "Prompt Construction": test_prompt_construction(),
         "Response Parsing": test_response_parsing(),
         "Evaluation": test_evaluation(),
+        "Statistics": test_statistics(),
+        "Hofstede Conversion": test_hofstede_conversion(),
         "API Keys": test_api_keys()
     }
     
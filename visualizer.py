@@ -5,7 +5,7 @@ Generates plots and charts for experiment results
 import matplotlib
 matplotlib.use('Agg')
 
-from analyze import analyze_hofstede_comparison
+from analyze import analyze_hofstede_comparison, read_results
 
 import pandas as pd
 import numpy as np
@@ -13,7 +13,6 @@ import matplotlib.pyplot as plt
 import seaborn as sns
 from pathlib import Path
 import logging
-import ast
 from collections import Counter
 
 import config
@@ -110,17 +109,15 @@ class Visualizer:
         """Plot most frequent values by culture"""
         fig, ax = plt.subplots(figsize=(12, 8))
         
-        # Explode top_values lists and count
-        all_values = []
-        for _, row in df.iterrows():
-            if isinstance(row['top_values'], list):
-                for value in row['top_values']:
-                    all_values.append({
-                        'culture': row['culture'],
-                        'value': value
-                    })
-        
-        values_df = pd.DataFrame(all_values)
+        # Explode top_values lists and count (plain tuples, no per-row Series)
+        values_df = pd.DataFrame(
+            [
+                (culture, value)
+                for culture, values in df[['culture', 'top_values']].itertuples(index=False, name=None)
+                for value in values
+            ],
+            columns=['culture', 'value']
+        )
         
         # Get top N values overall
         top_values = values_df['value'].value_counts().head(top_n).index
@@ -479,8 +476,7 @@ class Visualizer:
         # Plot 2: Value frequency comparison
         baseline_values = []
         for values_list in df[df['culture'] == 'baseline']['top_values']:
-            if isinstance(values_list, list):
-                baseline_values.extend(values_list)
+            baseline_values.extend(values_list)
         
         from collections import Counter
         baseline_value_counts = Counter(baseline_values)
@@ -507,13 +503,7 @@ class Visualizer:
         # Get baseline value distribution
         baseline_values = []
         for values_list in df[df['culture'] == 'baseline']['top_values']:
-            if isinstance(values_list, str):
-                try:
-                    values_list = ast.literal_eval(values_list)
-                except Exception:
-                    pass
-            if isinstance(values_list, list):
-                baseline_values.extend(values_list)
+            baseline_values.extend(values_list)
 
         baseline_counter = Counter(baseline_values)
         baseline_total = len(baseline_values)
@@ -525,13 +515,7 @@ class Visualizer:
 
             culture_values = []
             for values_list in df[df['culture'] == culture]['top_values']:
-                if isinstance(values_list, str):
-                    try:
-                        values_list = ast.literal_eval(values_list)
-                    except Exception:
-                        pass
-                if isinstance(values_list, list):
-                    culture_values.extend(values_list)
+                culture_values.extend(values_list)
 
             culture_counter = Counter(culture_values)
             culture_total = len(culture_values)
@@ -618,21 +602,7 @@ class Visualizer:
     def create_all_visualizations(self, results_file: Path):
         """Create all visualizations from results file"""
         logger.info(f"Loading results from {results_file}")
-        df = pd.read_csv(results_file)
-        
-        # Convert string lists to actual lists
-        if 'top_values' in df.columns:
-            def parse_top_values(x):
-                if isinstance(x, list):
-                    return x
-                if isinstance(x, str) and x.startswith('['):
-                    try:
-                        return ast.literal_eval(x)
-                    except (ValueError, SyntaxError):
-                        return []
-                return []
-
-            df['top_values'] = df['top_values'].apply(parse_top_values)
+        df = read_results(results_file)
 
         logger.info("Creating visualizations...")
         comparison_df = analyze_hofstede_comparison(df)